@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""
+Conditional requests cache. Github doesn't charge rate limit for
+``304 - Not modified`` responses
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from pygithub3.core.compat import OrderedDict
+
+
+class Cache(object):
+    """ Base of cache backends
+
+    It stores the ``ETag`` and ``Last-Modified`` of each GET response, sends
+    them as ``If-None-Match`` and ``If-Modified-Since`` in the next request to
+    the same url and serves the cached body if Github returns 304
+
+    :param int max_entries: Least recently used entries are evicted over it
+    :param int ttl: Seconds to keep an entry (optional)
+
+    Backends must implement ``_get``, ``_set``, ``_delete`` and ``clear``
+    """
+
+    HEADERS = ('etag', 'last-modified', 'link', 'content-type')
+
+    def __init__(self, max_entries=1000, ttl=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+    def _get(self, key):
+        raise NotImplementedError
+
+    def _set(self, key, value):
+        raise NotImplementedError
+
+    def _delete(self, key):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def get(self, key):
+        stored = self._get(key)
+        if stored is None:
+            return None
+        stored_at, value = stored
+        if self.ttl is not None and time.time() - stored_at > self.ttl:
+            self._delete(key)
+            return None
+        return value
+
+    def set(self, key, value):
+        self._set(key, (time.time(), value))
+
+    def delete(self, key):
+        self._delete(key)
+
+    @staticmethod
+    def key(url, params=None, accept=None):
+        """ Digest of url, params and Accept header """
+        params = '&'.join(['%s=%s' % item
+                           for item in sorted((params or {}).items())])
+        raw = '%s?%s#%s' % (url, params, accept or '')
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def request(self, session, url, **kwargs):
+        """ Send a conditional GET with ``session``
+
+        :returns: The response, with the cached body if it was not modified
+        """
+        headers = dict(kwargs.get('headers') or {})
+        params = dict(session.params)
+        params.update(kwargs.get('params') or {})
+        params.pop('access_token', None)  # Same content for every token
+        key = self.key(url, params, headers.get('Accept'))
+        entry = self.get(key)
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last-modified'):
+                headers['If-Modified-Since'] = entry['last-modified']
+            kwargs['headers'] = headers
+        response = session.request('get', url, **kwargs)
+        if response.status_code == 304 and entry:
+            return self.__from_entry(response, entry)
+        if response.status_code == 200:
+            self.__store(key, response)
+        return response
+
+    def __store(self, key, response):
+        entry = dict([(header, response.headers.get(header))
+                      for header in self.HEADERS])
+        if entry['etag'] or entry['last-modified']:
+            entry['content'] = response.content
+            self.set(key, entry)
+
+    def __from_entry(self, response, entry):
+        response.status_code = 200
+        response._content = entry['content']
+        response._content_consumed = True
+        for header in ('link', 'content-type'):
+            if entry.get(header):
+                response.headers[header] = entry[header]
+        response.from_cache = True
+        return response
+
+
+class MemoryCache(Cache):
+    """ In-memory LRU cache
+
+    ::
+
+        gh = Github(cache=MemoryCache(max_entries=500, ttl=3600))
+    """
+
+    def __init__(self, max_entries=1000, ttl=None):
+        super(MemoryCache, self).__init__(max_entries, ttl)
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def _get(self, key):
+        with self.lock:
+            stored = self.entries.pop(key, None)
+            if stored is not None:  # Most recently used at the end
+                self.entries[key] = stored
+            return stored
+
+    def _set(self, key, value):
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = value
+            while len(self.entries) > self.max_entries:
+                del self.entries[next(iter(self.entries))]
+
+    def _delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class SqliteCache(Cache):
+    """ On-disk LRU cache, it survives restarts and it can be shared between
+    processes
+
+    :param str path: Database file
+
+    ::
+
+        gh = Github(cache=SqliteCache('/var/cache/pygithub3.db', ttl=86400))
+
+    It's also a good cache of git ``objects``, which never expire::
+
+        gh = Github(objects=SqliteCache('/var/cache/git-objects.db',
+                                        max_entries=100000))
+    """
+
+    def __init__(self, path, max_entries=10000, ttl=None):
+        super(SqliteCache, self).__init__(max_entries, ttl)
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, timeout=30,
+                                          check_same_thread=False)
+        with self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, '
+                'value BLOB, accessed REAL)')
+            self.connection.execute(
+                'CREATE INDEX IF NOT EXISTS entries_accessed '
+                'ON entries (accessed)')
+
+    def _get(self, key):
+        with self.lock:
+            with self.connection:
+                row = self.connection.execute(
+                    'SELECT value FROM entries WHERE key = ?',
+                    (key, )).fetchone()
+                if row is None:
+                    return None
+                self.connection.execute(
+                    'UPDATE entries SET accessed = ? WHERE key = ?',
+                    (time.time(), key))
+        return pickle.loads(bytes(row[0]))
+
+    def _set(self, key, value):
+        value = sqlite3.Binary(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        with self.lock:
+            with self.connection:
+                self.connection.execute(
+                    'INSERT OR REPLACE INTO entries VALUES (?, ?, ?)',
+                    (key, value, time.time()))
+                self.connection.execute(
+                    'DELETE FROM entries WHERE key IN (SELECT key FROM '
+                    'entries ORDER BY accessed DESC LIMIT -1 OFFSET ?)',
+                    (self.max_entries, ))
+
+    def _delete(self, key):
+        with self.lock:
+            with self.connection:
+                self.connection.execute('DELETE FROM entries WHERE key = ?',
+                                        (key, ))
+
+    def clear(self):
+        with self.lock:
+            with self.connection:
+                self.connection.execute('DELETE FROM entries')
+
+    def __len__(self):
+        with self.lock:
+            return self.connection.execute(
+                'SELECT COUNT(*) FROM entries').fetchone()[0]
@@ -1,8 +1,14 @@
 # -*- encoding: utf-8 -*-
 
+import time
+
 import requests
 
+from pygithub3.exceptions import RateLimitExceeded
 from .errors import GithubError
+from .ratelimit import RateLimiter
+from .retry import Retry
+from .transport import Transport
 
 VALID_REQUEST_ARGS = set((
     'params', 'data', 'headers', 'cookies', 'files', 'auth', 'timeout',
@@ -13,8 +19,6 @@ VALID_REQUEST_ARGS = set((
 class Client(object):
     """ Client to send configurated requests"""
 
-    remaining_requests = '~'
-
     def __init__(self, **kwargs):
         self.requester = requests.session()
         self.config = {
@@ -22,11 +26,36 @@ class Client(object):
             'base_url': 'https://api.github.com/'
         }
         self.config.update(kwargs)
+        self.transport = (self.config.get('transport') or
+                          Transport.from_config(self.config))
+        self.transport.attach(self.requester)
+        self.ratelimit = self.config.get('ratelimit') or RateLimiter()
+        self.retry = self.config.get('retry') or Retry()
         self.set_credentials(self.config.get('login'),
                              self.config.get('password'))
         self.set_token(self.config.get('token'))
         self.__set_params(self.config)
 
+    @property
+    def credential(self):
+        """ Token, login or None (anonymous) of the requests """
+        return (self.requester.params.get('access_token') or
+                (self.requester.auth and self.requester.auth[0]) or None)
+
+    @property
+    def tokens(self):
+        """ Pool of tokens to rotate (``tokens`` config) """
+        return self.config.get('tokens') or ()
+
+    @property
+    def remaining_requests(self):
+        credentials = self.tokens or (self.credential, )
+        remainings = [self.ratelimit.get(credential).remaining
+                      for credential in credentials]
+        if None in remainings:
+            return '~'
+        return sum(remainings)
+
     @property
     def user(self):
         return self.config.get('user')
@@ -74,10 +103,52 @@ class Client(object):
     @__parse_kwargs
     def request(self, verb, request, **kwargs):
         request = "%s%s" % (self.config['base_url'], request)
-        response = self.requester.request(verb, request, **kwargs)
-        Client.remaining_requests = response.headers.get(
-            'x-ratelimit-remaining', -1)
-        GithubError(response).process()
+        if not self.tokens:
+            return self.__send(self.credential, verb, request, **kwargs)
+        attempts = len(self.tokens)
+        while True:  # Rotate tokens until one isn't rate limited
+            token = self.ratelimit.choose(self.tokens)
+            kwargs['params'] = dict(kwargs['params'], access_token=token)
+            try:
+                return self.__send(token, verb, request, **kwargs)
+            except RateLimitExceeded:
+                attempts -= 1
+                if not attempts:
+                    raise
+
+    def __send(self, credential, verb, request, **kwargs):
+        retry = 0
+        while True:
+            try:
+                response = self.__attempt(credential, verb, request,
+                                          **kwargs)
+            except Retry.ERRORS:
+                if not self.retry.allows(verb, retry):
+                    raise
+                response = None
+            else:
+                if not (self.retry.is_transient(response) and
+                        self.retry.allows(verb, retry)):
+                    break
+            time.sleep(self.retry.delay(retry, response))
+            retry += 1
+        try:
+            GithubError(response).process()
+        except RateLimitExceeded:
+            self.ratelimit.get(credential).exceeded += 1
+            raise
+        return response
+
+    def __attempt(self, credential, verb, request, **kwargs):
+        self.ratelimit.acquire(credential)
+        cache = self.config.get('cache')
+        # Streamed responses (without prefetch) aren't cached
+        if (cache is not None and verb == 'get' and
+           kwargs.get('prefetch') is not False):
+            response = cache.request(self.requester, request, **kwargs)
+        else:
+            response = self.requester.request(verb, request, **kwargs)
+        self.ratelimit.update(credential, response.headers)
         return response
 
     def get(self, request, **kwargs):
@@ -2,7 +2,8 @@
 # -*- encoding: utf-8 -*-
 
 from pygithub3.core import json
-from pygithub3.exceptions import NotFound, BadRequest, UnprocessableEntity
+from pygithub3.exceptions import (NotFound, BadRequest, UnprocessableEntity,
+                                  RateLimitExceeded)
 
 
 class GithubError(object):
@@ -11,10 +12,20 @@ class GithubError(object):
     def __init__(self, response):
         self.response = response
         self.status_code = response.status_code
+
+    @property
+    def debug(self):
+        """ Decoded error of the response. Only read on errors, so streamed
+        responses aren't consumed """
         try:
-            self.debug = json.loads(response.content)
+            return json.loads(self.response.content)
         except (ValueError, TypeError):
-            self.debug = {'message': response.content}
+            return {'message': self.response.content}
+
+    def error_403(self):
+        if self.response.headers.get('x-ratelimit-remaining') == '0':
+            raise RateLimitExceeded("403 - %s" % self.debug.get('message'))
+        self.response.raise_for_status()
 
     def error_404(self):
         raise NotFound("404 - %s" % self.debug.get('message'))
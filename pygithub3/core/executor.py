@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+from multiprocessing.pool import ThreadPool
+
+
+class Executor(object):
+    """ Run calls concurrently in a bounded pool of threads
+
+    :param int workers: Calls in flight at the same time
+
+    Each call returns a future (``AsyncResult``) with ``get``, ``wait``,
+    ``ready`` and ``successful`` methods. ``get`` raises the exception of the
+    call if it failed
+    ::
+
+        with Executor(workers=8) as executor:
+            futures = [executor.submit(gh.repos.get, 'octocat', repo)
+                       for repo in repos]
+            print [future.get() for future in futures]
+    """
+
+    def __init__(self, workers=4):
+        self.workers = workers
+        self.pool = ThreadPool(workers)
+
+    def submit(self, func, *args, **kwargs):
+        """ Call ``func`` in background
+
+        :returns: Future of its result
+        """
+        return self.pool.apply_async(func, args, kwargs)
+
+    def map(self, func, iterable):
+        """ Call ``func`` with each item in background
+
+        :returns: List of futures in the same order
+        """
+        return [self.submit(func, item) for item in iterable]
+
+    def close(self):
+        """ Wait for the pending calls and stop the threads """
+        self.pool.close()
+        self.pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -3,6 +3,7 @@
 Emulate json module with encode/decoders to support github datetime format
 """
 
+import re
 from datetime import datetime
 try:
     import simplejson as json
@@ -10,6 +11,9 @@ except ImportError:
     import json
 
 GITHUB_DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+GITHUB_DATE_LENGTH = len('2008-01-14T04:33:35Z')
+GITHUB_DATE_PATTERN = re.compile(
+    r'^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})Z$')
 
 
 class GHJSONEncoder(json.JSONEncoder):
@@ -20,13 +24,27 @@ class GHJSONEncoder(json.JSONEncoder):
             return super(GHJSONEncoder, self).default(o)
 
 
+def parse_date(value):
+    """ Datetime of a ``GITHUB_DATE_FORMAT`` string or None
+
+    It's faster than strptime and it doesn't raise with the rest of strings
+    """
+    if not isinstance(value, basestring) or len(value) != GITHUB_DATE_LENGTH:
+        return None
+    match = GITHUB_DATE_PATTERN.match(value)
+    if match is None:
+        return None
+    try:
+        return datetime(*map(int, match.groups()))
+    except ValueError:  # e.g: Month 13
+        return None
+
+
 def gh_decoder_hook(dict_):
     for k, v in dict_.iteritems():
-        try:
-            date = datetime.strptime(v, GITHUB_DATE_FORMAT)
+        date = parse_date(v)
+        if date is not None:
             dict_[k] = date
-        except:
-            continue
     return dict_
 
 
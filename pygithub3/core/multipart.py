@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+import os
+import uuid
+
+CHUNK_SIZE = 64 * 1024
+
+
+def file_size(fileobj):
+    """ Bytes left to read of a file-like object (or a mmap), or None """
+    try:
+        size = len(fileobj)  # mmap
+    except (AttributeError, TypeError):
+        try:
+            size = os.fstat(fileobj.fileno()).st_size
+        except (AttributeError, EnvironmentError, ValueError):
+            return None
+    try:
+        return size - fileobj.tell()
+    except (AttributeError, EnvironmentError):
+        return size
+
+
+class MultipartStream(object):
+    """ File-like ``multipart/form-data`` body which reads the file part in
+    chunks while it's sent, so it isn't loaded in memory
+
+    :param fields: Form fields (dict or list of pairs), before the file
+    :param str name: Form field of the file
+    :param file: File-like object (e.g file, mmap) or iterator of chunks
+    :param int size: Bytes of the file
+    :param str filename: Filename of the file part
+    :param int chunk_size: Bytes to read from the file each time
+    :param progress: Function called with the bytes sent and the total
+                     bytes each time the body is read
+    """
+
+    def __init__(self, fields, name, file, size, filename='file',
+                 chunk_size=CHUNK_SIZE, progress=None):
+        self.boundary = uuid.uuid4().hex
+        self.size = size
+        self.progress = progress
+        self.sent = 0
+        self.read_from_file = 0
+        self.head = self.__head(fields, name, filename)
+        self.tail = '\r\n--%s--\r\n' % self.boundary
+        if hasattr(file, 'read'):
+            chunks = iter(lambda: file.read(chunk_size), '')
+        else:
+            chunks = iter(file)
+        self.parts = self.__parts(chunks)
+        self.chunk = ''
+        self.offset = 0
+
+    @property
+    def content_type(self):
+        return 'multipart/form-data; boundary=%s' % self.boundary
+
+    @staticmethod
+    def __encode(value):
+        if isinstance(value, unicode):
+            return value.encode('utf-8')
+        return str(value)
+
+    def __head(self, fields, name, filename):
+        if hasattr(fields, 'items'):
+            fields = fields.items()
+        head = []
+        for field, value in fields:
+            head.append('--%s\r\nContent-Disposition: form-data; '
+                        'name="%s"\r\n\r\n%s\r\n' % (
+                        self.boundary, self.__encode(field),
+                        self.__encode(value)))
+        head.append('--%s\r\nContent-Disposition: form-data; name="%s"; '
+                    'filename="%s"\r\nContent-Type: application/octet-stream'
+                    '\r\n\r\n' % (self.boundary, self.__encode(name),
+                                  self.__encode(filename)))
+        return ''.join(head)
+
+    def __parts(self, chunks):
+        yield self.head
+        for chunk in chunks:
+            self.read_from_file += len(chunk)
+            yield chunk
+        if self.read_from_file != self.size:
+            raise ValueError('Read %d bytes of the file instead of %d' % (
+                             self.read_from_file, self.size))
+        yield self.tail
+
+    def __len__(self):
+        return len(self.head) + self.size + len(self.tail)
+
+    def read(self, size=-1):
+        """ Next bytes of the body ('' at the end) """
+        data = []
+        left = size
+        while size < 0 or left > 0:
+            if self.offset >= len(self.chunk):
+                try:
+                    self.chunk, self.offset = next(self.parts), 0
+                except StopIteration:
+                    break
+                continue
+            end = len(self.chunk) if size < 0 else self.offset + left
+            piece = self.chunk[self.offset:end]
+            self.offset += len(piece)
+            left -= len(piece)
+            data.append(piece)
+        data = ''.join(data)
+        self.sent += len(data)
+        if self.progress is not None and data:
+            self.progress(self.sent, len(self))
+        return data
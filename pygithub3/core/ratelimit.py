@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+import threading
+import time
+
+from pygithub3.exceptions import RateLimitExceeded
+
+
+class RateLimit(object):
+    """ Rate limit of one credential, updated with the ``x-ratelimit-*``
+    headers of its responses
+
+    It's also a token bucket which spreads the remaining requests over the
+    time left to the reset
+    """
+
+    def __init__(self, burst=10):
+        self.limit = None
+        self.remaining = None
+        self.reset = None
+        self.burst = burst
+        self.tokens = burst
+        self.stamp = time.time()
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.exceeded = 0
+
+    @staticmethod
+    def __header(headers, name):
+        try:
+            return int(headers.get(name))
+        except (TypeError, ValueError):
+            return None
+
+    def update(self, headers):
+        remaining = self.__header(headers, 'x-ratelimit-remaining')
+        if remaining is None:
+            return
+        with self.lock:
+            self.remaining = remaining
+            self.limit = self.__header(headers, 'x-ratelimit-limit')
+            self.reset = self.__header(headers, 'x-ratelimit-reset')
+
+    def exhausted(self, now=None):
+        """ Seconds to the reset if there aren't remaining requests, else 0 """
+        now = now or time.time()
+        if self.remaining is None or self.remaining > 0:
+            return 0
+        return max((self.reset or now) - now, 0)
+
+    def reserve(self, pace=True, now=None):
+        """ Take a request of the budget
+
+        :returns: Seconds to wait before sending it
+        """
+        now = now or time.time()
+        with self.lock:
+            if self.remaining is None:  # Unknown until the first response
+                return 0
+            self.remaining = max(self.remaining - 1, 0)
+            if not pace or not self.reset:
+                return 0
+            rate = (self.remaining + 1) / float(max(self.reset - now, 1))
+            self.tokens = min(self.burst,
+                              self.tokens + (now - self.stamp) * rate)
+            self.stamp = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0
+            return -self.tokens / rate
+
+    def budget(self):
+        return dict(limit=self.limit, remaining=self.remaining,
+                    reset=self.reset, requests=self.requests,
+                    exceeded=self.exceeded)
+
+
+class RateLimiter(object):
+    """ Rate limits per credential (token, login or anonymous)
+
+    :param bool pace: Spread the remaining requests over the time left to the
+                      reset, instead of spending them as fast as possible
+    :param bool wait: When a credential is exhausted, wait until the reset
+                      instead of raising
+                      :class:`~pygithub3.exceptions.RateLimitExceeded`
+    :param int burst: Requests which can be sent at once when pacing
+
+    ::
+
+        gh = Github(token='...', ratelimit=RateLimiter(pace=True, wait=True))
+    """
+
+    def __init__(self, pace=False, wait=False, burst=10):
+        self.pace = pace
+        self.wait = wait
+        self.burst = burst
+        self.limits = {}
+        self.lock = threading.Lock()
+
+    def get(self, credential):
+        """ :class:`RateLimit` of the credential """
+        with self.lock:
+            if credential not in self.limits:
+                self.limits[credential] = RateLimit(self.burst)
+            return self.limits[credential]
+
+    def acquire(self, credential):
+        """ Block until the credential can send a request
+
+        :raises: :class:`~pygithub3.exceptions.RateLimitExceeded` if it's
+                 exhausted and it doesn't wait
+        """
+        limit = self.get(credential)
+        exhausted = limit.exhausted()
+        if exhausted and not self.wait:
+            raise RateLimitExceeded(
+                'Rate limit exhausted, it resets in %d seconds' % exhausted)
+        limit.requests += 1
+        if exhausted:
+            time.sleep(exhausted)
+            return
+        delay = limit.reserve(self.pace)
+        if delay:
+            time.sleep(delay)
+
+    def update(self, credential, headers):
+        self.get(credential).update(headers)
+
+    def choose(self, credentials):
+        """ Credential with the most remaining requests (unused ones first)
+        or, if all are exhausted, the first to reset """
+        now = time.time()
+        available = [credential for credential in credentials
+                     if not self.get(credential).exhausted(now)]
+        if available:
+            return max(available, key=self.__remaining)
+        return min(credentials, key=lambda credential:
+                   self.get(credential).reset)
+
+    def __remaining(self, credential):
+        remaining = self.get(credential).remaining
+        return float('inf') if remaining is None else remaining
+
+    def budget(self):
+        """ Limit, remaining requests, reset timestamp, requests sent and
+        rate limit errors per credential """
+        with self.lock:
+            limits = self.limits.items()
+        return dict([(credential, limit.budget())
+                     for credential, limit in limits])
@@ -1,7 +1,15 @@
 #!/usr/bin/env python
 # -*- encoding: utf-8 -*-
 
+import copy
 import functools
+import gzip
+import time
+
+from pygithub3.core import json
+from pygithub3.resources.base import Json
+
+MAX_PER_PAGE = 100  # Github limit
 
 
 class Method(object):
@@ -11,10 +19,55 @@ class Method(object):
         self.method = functools.partial(method, request, **method_args)
         self.resource = request.resource
         self.cache = {}
+        self.identities = None
+        self.max_cached_pages = None
+        self.start = 1
+        self.limited = False
+        self.unshrunk = None
 
     def __call__(self):
         raise NotImplementedError
 
+    def shrink(self, per_page):
+        """ Request pages of ``per_page`` resources if it's lower than the
+        maximum and it hasn't requested or resumed any page yet (the pages
+        numbers of the next requests depend on it). See :meth:`restore`
+        """
+        if (per_page < MAX_PER_PAGE and not self.cache and self.start == 1 and
+           not hasattr(self, 'last_page')):
+            self.unshrunk = self.method
+            self.method = functools.partial(self.method, per_page=per_page)
+
+    def restore(self):
+        """ Request pages of the original size again, forgetting the ones
+        requested after :meth:`shrink`
+
+        :returns: If it was shrunk
+        """
+        if self.unshrunk is None:
+            return False
+        self.method, self.unshrunk = self.unshrunk, None
+        self.cache.clear()
+        return True
+
+    def clone(self):
+        """ Method of the same request and start, without cached pages """
+        clone = copy.copy(self)
+        clone.cache = {}
+        clone.identities = None
+        clone.limited = False
+        return clone
+
+    def evict(self, page):
+        """ Discard the cached pages before the last ``max_cached_pages``
+        to ``page`` (the consumed one) """
+        if self.max_cached_pages is None:
+            return
+        oldest = page - self.max_cached_pages
+        for cached_page in list(self.cache):
+            if int(cached_page) <= oldest:
+                self.cache.pop(cached_page, None)
+
 
 class Page(object):
     """ Iterator of resources """
@@ -99,11 +152,111 @@ class Result(object):
     def next(self):
         return self.__next__()
 
-    def iterator(self):
-        """ generator """
-        for page in self:
-            for resource in page:
-                yield resource
+    def iterator(self, limit=None, until=None):
+        """ generator
+
+        :param int limit: Resources to return at most
+        :param until: Function which gets each resource. It stops before the
+                      first resource for which it returns True
+
+        It doesn't request more pages after stopping (nor prefetches or
+        reads ahead meanwhile), and the next iteration starts from the first
+        page again. With a ``limit`` lower than a page, it requests a page of
+        ``limit`` resources, which is discarded after the iteration.
+
+        If it fails, the result keeps its position (see ``cursor``)
+        """
+        if limit is not None and limit <= 0:
+            return
+        getter = self.getter
+        if limit is not None:
+            getter.shrink(limit)
+        getter.limited = limit is not None or until is not None
+        stopped = False
+        try:
+            count = 0
+            for page in self:
+                for resource in page:
+                    if until is not None and until(resource):
+                        stopped = True
+                        return
+                    yield resource
+                    count += 1
+                    if count == limit:
+                        stopped = True
+                        return
+            stopped = True
+        finally:
+            getter.limited = False
+            if getter.restore() or stopped:
+                self._reset()
+
+    def _reset(self):
+        """ Go back to the first page """
+        raise NotImplementedError
+
+    def all(self, limit=None, until=None):
+        """ List of resources. See :meth:`iterator` """
+        return list(self.iterator(limit, until))
+
+    def intern(self):
+        """ Share the repeated users, orgs and repos between all the pages
+        (by default they're only shared inside each page)
+
+        :returns: The same result
+        """
+        self.getter.identities = {}
+        return self
+
+    def export(self, fileobj, format='jsonl', compress=False):
+        """ Write the resources to a file, page by page
 
-    def all(self):
-        return list(self.iterator())
+        :param file fileobj: File (opened in binary mode) to write to
+        :param str format: ``jsonl``, a json document per line (the only one)
+        :param bool compress: Write it gzipped
+        :returns: Stats of the export: ``resources``, ``pages``, ``bytes``
+                  written (uncompressed) and ``seconds``
+
+        It requests the pages again from the first one (or the resumed one)
+        in a copy of the result, which decodes them as plain json and only
+        keeps the last one in memory (see :meth:`stream`). The result
+        itself doesn't change
+        ::
+
+            with open('commits.jsonl.gz', 'wb') as fileobj:
+                print some_request().export(fileobj, compress=True)
+        """
+        if format != 'jsonl':
+            raise ValueError("'%s' format isn't supported" % format)
+        result = type(self)(self.getter.clone())
+        result.getter.resource = Json
+        result.stream()
+        result._reset()
+        stats = dict(resources=0, pages=0, bytes=0)
+        start = time.time()
+        if compress:
+            fileobj = gzip.GzipFile(fileobj=fileobj, mode='wb')
+        try:
+            for page in result:
+                lines = [json.dumps(resource) for resource in page]
+                if lines:
+                    content = '\n'.join(lines) + '\n'
+                    fileobj.write(content)
+                    stats['bytes'] += len(content)
+                stats['resources'] += len(lines)
+                stats['pages'] += 1
+        finally:
+            if compress:
+                fileobj.close()  # Only the gzip stream
+        stats['seconds'] = time.time() - start
+        return stats
+
+    def stream(self, pages=1):
+        """ Keep only the last consumed pages in the cache, so iterating it
+        takes the same memory whatever the number of pages
+
+        :param int pages: Consumed pages to keep cached
+        :returns: The same result
+        """
+        self.getter.max_cached_pages = max(pages, 1)
+        return self
@@ -1,41 +1,170 @@
 #!/usr/bin/env python
 # -*- encoding: utf-8 -*-
 
+import threading
+
 from . import base
 from .link import Link
 
 
+#: Params of the next links which aren't saved in the cursors
+PRIVATE_PARAMS = ('access_token', )
+
+
 class Method(base.Method):
     """ Cache support and builds next request """
 
     def __init__(self, *args, **kwargs):
         super(Method, self).__init__(*args, **kwargs)
+        self.session_params = {}
         self.next = True
+        self.fetched = 0
+        self.read_ahead = 0
+        self.reading = False
+        self.reader = None
+        self.target = 0
+        self.error = None
+        self.condition = threading.Condition()
 
     def cached(func):
         def wrapper(self, page=1):
+            if self.read_ahead:
+                self.__wait_reader(page)
             if str(page) in self.cache:
-                return self.cache[str(page)]['content']
-            return func(self, page)
+                content = self.cache[str(page)]['content']
+            else:
+                content = func(self, page)
+            if self.read_ahead and not self.limited:
+                self.__start_reader(page + self.read_ahead)
+            self.evict(page)
+            return content
         return wrapper
 
     def next_getter_from(self, response):
         link = Link(response.headers.get('link'))
         if hasattr(link, 'next'):
             return base.functools.partial(self.method, **link.next.params)
-        self.next = False
 
-    @cached
-    def __call__(self, page=1):
+    @property
+    def private_params(self):
+        """ Credentials and session params (they're added to each request) """
+        return set(PRIVATE_PARAMS) | set(self.session_params)
+
+    def clone(self):
+        clone = super(Method, self).clone()
+        clone.reading, clone.reader, clone.target, clone.error = (
+            False, None, 0, None)
+        clone.condition = threading.Condition()
+        prev = self.cache.get(str(self.start - 1))
+        if self.start > 1 and prev is not None:  # Keep the resumed link
+            clone.cache[str(self.start - 1)] = dict(content=[],
+                                                    next=prev['next'])
+            clone.next = prev['next'] is not None
+        else:
+            clone.start, clone.next = 1, True
+        clone.fetched = clone.start - 1
+        return clone
+
+    def restore(self):
+        if not super(Method, self).restore():
+            return False
+        self.fetched = 0
+        self.next = True
+        return True
+
+    def rewind(self, page):
+        """ Request the pages again from ``page`` (discarding the cached ones
+        after it), if it's the first one or the link to it is cached
+
+        :returns: If it can
+        """
+        prev = self.cache.get(str(page - 1))
+        if page > 1 and (prev is None or prev['next'] is None):
+            return False
+        for cached_page in list(self.cache):
+            if int(cached_page) >= page:
+                self.cache.pop(cached_page, None)
+        self.fetched = page - 1
+        self.next = True
+        return True
+
+    def evict(self, page):
+        """ It keeps the link to the resumed page. See :meth:`rewind` """
+        resumed = self.cache.get(str(self.start - 1))
+        super(Method, self).evict(page)
+        if self.start > 1 and resumed is not None:
+            self.cache[str(self.start - 1)] = resumed
+
+    def resume(self, page, params):
+        """ Continue from ``page``, requested with the ``params`` of the
+        previous page's next link (None if there isn't more pages) """
+        self.start = page
+        self.fetched = page - 1
+        self.next = params is not None
+        if page > 1:  # Previous page without content, only its next link
+            self.cache[str(page - 1)] = {
+                'content': [],
+                'next': (base.functools.partial(self.method, **params)
+                         if params is not None else None)}
+
+    def __fetch(self, page):
         prev = self.cache.get(str(page - 1))
         method = prev and prev['next'] or self.method
         response = method()
+        next_getter = self.next_getter_from(response)
         self.cache[str(page)] = {
-            'content': self.resource.loads(response.content),
-            'next': self.next_getter_from(response)
+            'content': self.resource.loads(response.content,
+                                           identities=self.identities),
+            'next': next_getter
         }
+        self.fetched = max(self.fetched, page)
+        if next_getter is None:  # After caching it. See Result.__next__
+            self.next = False
         return self.cache[str(page)]['content']
 
+    def __wait_reader(self, page):
+        """ Wait until the reader gets the page or stops """
+        with self.condition:
+            while (str(page) not in self.cache and self.reading and
+                   self.error is None):
+                self.condition.wait()
+            if str(page) not in self.cache and self.error is not None:
+                error, self.error = self.error, None
+                raise error
+
+    def __start_reader(self, target):
+        """ Read ahead until ``target`` page in background """
+        with self.condition:
+            self.target = max(self.target, target)
+            if (self.reading or self.error is not None or not self.next or
+               self.fetched >= self.target):
+                return
+            self.reading = True
+        self.reader = threading.Thread(target=self.__read)
+        self.reader.daemon = True
+        self.reader.start()
+
+    def __read(self):
+        try:
+            while True:
+                with self.condition:
+                    page = self.fetched + 1
+                    if not self.next or page > self.target:
+                        break
+                self.__fetch(page)
+                with self.condition:
+                    self.condition.notify_all()
+        except Exception as error:
+            with self.condition:
+                self.error = error
+        with self.condition:
+            self.reading = False
+            self.condition.notify_all()
+
+    @cached
+    def __call__(self, page=1):
+        return self.__fetch(page)
+
 
 class Page(base.Page):
     """ Consumed when instance """
@@ -72,17 +201,46 @@ class Result(base.Result):
         result = some_request()
         print result.all()
 
-    """
-
-    """ TODO: limit in {all/iterator}
     .. note::
-        You can use ``limit`` with `all` and `iterator`
+        You can use ``limit`` and ``until`` with ``all`` and ``iterator``
         ::
+
             result = some_request()
             _5resources = result.all(limit=5)
+            recent = result.all(until=lambda commit:
+                                commit.commit.author.date < yesterday)
 
         This exists because it can't request a explitic page, and some requests
         can have thousand of resources (e.g Repository's commits)
+
+    .. note::
+        It keeps every page in memory to iterate it again without requests.
+        With :meth:`stream` it only keeps the last consumed pages, so
+        iterating it again requests the pages again
+        ::
+
+            result = some_request().stream()
+            for resource in result.iterator():
+                print resource
+
+    .. note::
+        It can't request an explicit page, so to resume a long iteration
+        save its :attr:`cursor` and :meth:`resume` the same request
+        ::
+
+            result = some_request()
+            for page in result.resume(load_checkpoint()):
+                process(list(page))
+                save_checkpoint(result.cursor)
+
+    .. note::
+        With :meth:`read_ahead` it requests the next pages in background
+        while you consume the current one
+        ::
+
+            result = some_request().read_ahead(pages=2)
+            for resource in result.iterator():
+                print resource
     """
 
     def __init__(self, method):
@@ -97,19 +255,71 @@ class Result(base.Result):
                     page = Page(self.getter, self._counter)
                     self._counter += 1
                     return page
-                self._reset()
-                raise StopIteration
+                # Stopped before the last page or discarded by stream
+                if not self.getter.rewind(self._counter):
+                    self._reset()
+                    raise StopIteration
+                self._counter -= 1
+                self._cached = False
             return func(self)
         return wrapper
 
+    def read_ahead(self, pages=1):
+        """ Fetch the next pages in background
+
+        :param int pages: Pages to request ahead of the consumed one
+        :returns: The same result
+        """
+        self.getter.read_ahead = pages
+        return self
+
+    @property
+    def cursor(self):
+        """ Json-serializable position of the iteration: ``page`` to
+        return next and ``params`` of its request (None after the last one),
+        without the token and the session params
+
+        It raises ``ValueError`` if the previous page (with the link to the
+        next one) isn't cached anymore
+        """
+        page = self._counter if self._cached else self._counter + 1
+        prev = self.getter.cache.get(str(page - 1))
+        if prev is None:
+            if page > 1:
+                raise ValueError("Page %d link isn't cached" % (page - 1))
+            params = {}
+        elif prev['next'] is None:
+            params = None
+        else:
+            private = self.getter.private_params
+            params = dict([(key, value)
+                           for key, value in prev['next'].keywords.items()
+                           if key not in private])
+        return dict(page=page, params=params)
+
+    def resume(self, cursor):
+        """ Continue the iteration from a :attr:`cursor` of the same request
+
+        :returns: The same result
+        """
+        if cursor['page'] > 1 and cursor['params'] == {}:
+            raise ValueError("Cursor of page %d without its params" %
+                             cursor['page'])
+        self.getter.resume(cursor['page'], cursor['params'])
+        self._counter = cursor['page'] - 1
+        self._cached = False
+        return self
+
     @_get_cached
     def __next__(self):
-        if self.getter.next:
-            self._counter += 1
-            return Page(self.getter, self._counter)
+        # The reader could find the last page meanwhile
+        if self.getter.next or str(self._counter + 1) in self.getter.cache:
+            page = Page(self.getter, self._counter + 1)
+            self._counter += 1  # Once it's loaded, for the cursor
+            return page
         self._reset()
         raise StopIteration
 
     def _reset(self):
-        self._counter = 1
+        self._counter = self.getter.start
         self._cached = True
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- encoding: utf-8 -*-
 
+from multiprocessing.pool import ThreadPool
+
 from . import base
 from .link import Link
 
@@ -8,12 +10,23 @@ from .link import Link
 class Method(base.Method):
     """ Lazy and cache support """
 
+    def __init__(self, *args, **kwargs):
+        super(Method, self).__init__(*args, **kwargs)
+        self.workers = None
+        self.pending = {}
+
     def cached(func):
         """ Decorator to don't do a request if it's cached """
         def wrapper(self, page=1):
             if str(page) in self.cache:
-                return self.cache[str(page)]
-            return func(self, page)
+                self.pending.pop(page, None)
+                content = self.cache[str(page)]
+            else:
+                content = func(self, page)
+            if self.workers and not self.limited:
+                self.__prefetch(page)
+            self.evict(page)
+            return content
         return wrapper
 
     def if_needs_lastpage(func):
@@ -33,14 +46,49 @@ class Method(base.Method):
         link = Link(link_header)
         self.last_page = int(link.last.params.get('page'))
 
-    @cached
-    def __call__(self, page=1):
-        """ Call a real request """
+    def __fetch(self, page):
         response = self.method(page=page)
         self.__set_last_page_from(response.headers.get('link'))
-        self.cache[str(page)] = self.resource.loads(response.content)
+        self.cache[str(page)] = self.resource.loads(
+            response.content, identities=self.identities)
         return self.cache[str(page)]
 
+    def __prefetch(self, consumed):
+        """ Fetch the ``workers`` pages after ``consumed`` concurrently into
+        the cache """
+        last = min(consumed + self.workers, self.last_page)
+        pages = [page for page in xrange(consumed + 1, last + 1)
+                 if str(page) not in self.cache and page not in self.pending]
+        if not pages:
+            return
+        pool = ThreadPool(min(self.workers, len(pages)))
+        for page in pages:
+            self.pending[page] = pool.apply_async(self.__fetch, (page, ))
+        pool.close()
+
+    @cached
+    def __call__(self, page=1):
+        """ Call a real request """
+        if page in self.pending:  # Wait for the prefetching
+            return self.pending.pop(page).get()
+        return self.__fetch(page)
+
+    def clone(self):
+        clone = super(Method, self).clone()
+        clone.pending = {}
+        return clone
+
+    def restore(self):
+        if not super(Method, self).restore():
+            return False
+        for pending in self.pending.values():
+            pending.wait()
+        self.pending.clear()
+        self.cache.clear()
+        if hasattr(self, 'last_page'):
+            del self.last_page
+        return True
+
     @property
     def last(self):
         if not hasattr(self, 'last_page'):
@@ -81,20 +129,90 @@ class Result(base.Result):
             assert result.pages > 3
             page3 = result.get_page(3)
             page3_resources = list(page3)
+
+    .. note::
+        Save its :attr:`cursor` to :meth:`resume` a long iteration later
+        ::
+
+            result = some_request().resume(load_checkpoint())
+            for page in result:
+                process(list(page))
+                save_checkpoint(result.cursor)
+
+    .. note::
+        It keeps every page in memory to iterate it again without requests.
+        With :meth:`stream` it only keeps the last consumed pages
+        ::
+
+            result = some_request().stream()
+            for resource in result.iterator():
+                print resource
+
+    .. note::
+        With :meth:`prefetch`, after each consumed page it requests the
+        next ``workers`` pages concurrently, so walking all of them costs
+        about one round-trip every ``workers`` pages
+        ::
+
+            result = some_request().prefetch(workers=8)
+            print result.all()
     """
 
     def __init__(self, method):
         super(Result, self).__init__(method)
         self.page = base.Page(self.getter)
+        self.returned = None
 
     def __next__(self):
         if self.page <= self.pages:
             page_to_return = self.page
+            self.returned = page_to_return
             self.page = base.Page(self.getter, page_to_return + 1)
             return page_to_return
-        self.page = base.Page(self.getter)
+        self._reset()
         raise StopIteration
 
+    def _reset(self):
+        self.page = base.Page(self.getter, self.getter.start)
+        self.returned = None
+
+    def prefetch(self, workers=4):
+        """ Fetch the next pages concurrently after each consumed one
+
+        :param int workers: Pages requested ahead of the consumed one, at the
+                            same time
+        :returns: The same result
+
+        It keeps the pages order, and it doesn't prefetch while iterating
+        with ``limit`` or ``until``
+        """
+        self.getter.workers = workers
+        return self
+
+    @property
+    def cursor(self):
+        """ Json-serializable position of the iteration: ``page`` to
+        return next and ``last_page`` (None if it's unknown yet). The last
+        returned page is returned again if it couldn't be loaded """
+        page = self.page.page
+        returned = self.returned
+        if (returned is not None and str(returned.page) not in
+           self.getter.cache and not hasattr(returned, 'count')):
+            page = returned.page
+        return dict(page=page,
+                    last_page=getattr(self.getter, 'last_page', None))
+
+    def resume(self, cursor):
+        """ Continue the iteration from a :attr:`cursor` of the same request
+
+        :returns: The same result
+        """
+        if cursor.get('last_page') is not None:
+            self.getter.last_page = cursor['last_page']
+        self.getter.start = cursor['page']
+        self.page = base.Page(self.getter, cursor['page'])
+        return self
+
     @property
     def pages(self):
         """ Total number of pages in request """
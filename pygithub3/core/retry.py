@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+import random
+
+from requests.exceptions import ConnectionError, Timeout
+
+
+class Retry(object):
+    """ Policy to resend requests after transient failures: connection
+    errors, timeouts, server errors and abuse limits
+
+    :param int attempts: Tries of each request (including the first one).
+                         ``1`` disables the retries
+    :param float backoff: Base of the exponential backoff, in seconds. The
+                          delay of each retry is a random value between 0 and
+                          ``backoff * 2 ** retry`` (full jitter)
+    :param float max_backoff: Limit of the backoff delay
+    :param tuple statuses: Status codes to retry
+    :param tuple verbs: Verbs to retry. Only idempotent verbs by default
+
+    A ``Retry-After`` header has precedence over the backoff
+    ::
+
+        gh = Github(retry=Retry(attempts=5, backoff=1))
+    """
+
+    STATUSES = (429, 502, 503, 504)
+    VERBS = ('get', 'head', 'put', 'delete')
+    ERRORS = (ConnectionError, Timeout)
+
+    def __init__(self, attempts=3, backoff=0.5, max_backoff=60,
+                 statuses=STATUSES, verbs=VERBS):
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = statuses
+        self.verbs = verbs
+
+    def allows(self, verb, retry):
+        """ If the ``retry`` (0 is the first one) of a request is allowed """
+        return verb.lower() in self.verbs and retry < self.attempts - 1
+
+    def is_transient(self, response):
+        """ If the response is a failure to retry """
+        if response.status_code in self.statuses:
+            return True
+        # Abuse rate limit, not the exhausted one
+        return (response.status_code == 403 and
+                response.headers.get('retry-after') is not None and
+                response.headers.get('x-ratelimit-remaining') != '0')
+
+    def delay(self, retry, response=None):
+        """ Seconds to wait before the ``retry`` """
+        if response is not None:
+            try:
+                return max(int(response.headers.get('retry-after')), 0)
+            except (TypeError, ValueError):
+                pass
+        return random.uniform(0, min(self.max_backoff,
+                                     self.backoff * 2 ** retry))
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+from requests.packages.urllib3.poolmanager import PoolManager
+
+
+class Transport(object):
+    """ Connection pool shared by several clients
+
+    Each :class:`~pygithub3.core.client.Client` keeps its own session (auth,
+    params...) but sends the requests through the transport's pool, so all the
+    services built from one :class:`~pygithub3.Github` reuse the keep-alive
+    connections to the API
+
+    :param int pool_connections: Number of hosts to keep pools for
+    :param int pool_maxsize: Connections to keep alive per host
+    :param bool pool_block: Wait for a free connection instead of opening
+                            one out of the pool
+    """
+
+    OPTIONS = ('pool_connections', 'pool_maxsize', 'pool_block')
+
+    def __init__(self, pool_connections=10, pool_maxsize=10,
+                 pool_block=False):
+        self.poolmanager = PoolManager(num_pools=pool_connections,
+                                       maxsize=pool_maxsize,
+                                       block=pool_block)
+
+    @classmethod
+    def from_config(cls, config):
+        """ Build it with the pool options of a service ``config`` """
+        return cls(**dict([(option, config[option])
+                           for option in cls.OPTIONS if option in config]))
+
+    def attach(self, session):
+        """ Send the ``session`` requests through this transport """
+        session.poolmanager = self.poolmanager
+        return session
+
+    def stats(self):
+        """ Connection reuse per host
+
+        :returns: A dict like ``{'https://api.github.com:443': {
+            'connections': 2, 'requests': 40, 'reused': 38}}``
+        """
+        stats = {}
+        for key in self.poolmanager.pools.keys():
+            pool = self.poolmanager.pools.get(key)
+            if pool is None:  # Discarded meanwhile
+                continue
+            scheme, host, port = key
+            stats['%s://%s:%s' % (scheme, host, port)] = {
+                'connections': pool.num_connections,
+                'requests': pool.num_requests,
+                'reused': max(pool.num_requests - pool.num_connections, 0),
+            }
+        return stats
+
+    def close(self):
+        """ Close all the pooled connections """
+        self.poolmanager.clear()
@@ -40,3 +40,10 @@ class NotFound(Exception):
     Caught with a pygithub3-exception to `services.base.Service._bool` method
     """
     pass
+
+
+class RateLimitExceeded(Exception):
+    """ Raised when server response is 403 because of the rate limit, or
+    before sending a request with an exhausted credential. See
+    :class:`~pygithub3.core.ratelimit.RateLimiter` """
+    pass
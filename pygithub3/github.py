@@ -11,9 +11,13 @@ class Github(object):
     Example::
 
         gh = Github(user='kennethreitz', token='ABC...', repo='requests')
+
+    All the services share one connection pool (see :attr:`pool_stats`)
     """
 
     def __init__(self, **config):
+        from pygithub3.core.ratelimit import RateLimiter
+        from pygithub3.core.transport import Transport
         from pygithub3.services.users import User
         from pygithub3.services.repos import Repo
         from pygithub3.services.gists import Gist
@@ -22,6 +26,12 @@ class Github(object):
         from pygithub3.services.pull_requests import PullRequests
         from pygithub3.services.orgs import Org
         from pygithub3.services.issues import Issue
+        if not config.get('transport'):
+            config['transport'] = Transport.from_config(config)
+        self._transport = config['transport']
+        if not config.get('ratelimit'):
+            config['ratelimit'] = RateLimiter()
+        self._ratelimit = config['ratelimit']
         self._users = User(**config)
         self._repos = Repo(**config)
         self._gists = Gist(**config)
@@ -34,8 +44,39 @@ class Github(object):
     @property
     def remaining_requests(self):
         """ Limit of Github API v3 """
-        from pygithub3.core.client import Client
-        return Client.remaining_requests
+        return self._users.remaining_requests
+
+    @property
+    def rate_limits(self):
+        """ Limit, remaining requests and reset timestamp per credential.
+        See :class:`~pygithub3.core.ratelimit.RateLimiter` """
+        return self._ratelimit.budget()
+
+    def deferred(self, workers=4):
+        """ Github whose service calls return futures. See
+        :class:`~pygithub3.services.base.Deferred`
+
+        :param int workers: Calls in flight at the same time
+        """
+        from pygithub3.core.executor import Executor
+        from pygithub3.services.base import Deferred
+        return Deferred(self, Executor(workers))
+
+    def batch(self, workers=4):
+        """ Github which queues its service calls to run them concurrently
+        and collect them in order. See :class:`~pygithub3.services.base.Batch`
+
+        :param int workers: Calls in flight at the same time
+        """
+        from pygithub3.core.executor import Executor
+        from pygithub3.services.base import Batch
+        return Batch(self, Executor(workers))
+
+    @property
+    def pool_stats(self):
+        """ Connections opened and requests sent per host through the shared
+        pool. See :meth:`~pygithub3.core.transport.Transport.stats` """
+        return self._transport.stats()
 
     @property
     def users(self):
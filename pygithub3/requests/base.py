@@ -1,6 +1,8 @@
 # -*- encoding: utf-8 -*-
 
+import pkgutil
 import re
+from string import Formatter
 
 from pygithub3.core import json
 from pygithub3.core.compat import import_module
@@ -10,6 +12,30 @@ from pygithub3.resources.base import Raw
 
 ABS_IMPORT_PREFIX = 'pygithub3.requests'
 
+# 'repos/{user}/{repo}' => 'repos/%(user)s/%(repo)s'
+_uri_templates = {}
+
+
+def compile_uri(uri):
+    """ Precompiled %-template of a ``Request.uri`` """
+    try:
+        return _uri_templates[uri]
+    except KeyError:
+        pass
+    chunks = []
+    for literal, field, spec, conversion in Formatter().parse(uri.strip('/')):
+        chunks.append(literal.replace('%', '%%'))
+        if field is None:
+            continue
+        if spec or conversion or not re.match(r'^\w+$', field):
+            template = None  # Not supported, str.format it
+            break
+        chunks.append('%%(%s)s' % field)
+    else:
+        template = ''.join(chunks)
+    _uri_templates[uri] = template
+    return template
+
 
 class Body(object):
     """ Input's request handler """
@@ -59,8 +85,12 @@ class Request(object):
         return self.populate_uri()
 
     def populate_uri(self):
+        template = compile_uri(self.uri)
         try:
-            populated_uri = self.uri.format(**self.args)
+            if template is None:
+                populated_uri = self.uri.format(**self.args)
+            else:
+                populated_uri = template % self.args
         except KeyError:
             raise ValidationError(
                 "'%s' request wasn't be able to populate the uri '%s' with "
@@ -92,9 +122,13 @@ class Request(object):
 
 
 class Factory(object):
-    """ Request builder """
+    """ Request builder
+
+    It caches the resolved request classes
+    """
 
     import_pattern = re.compile(r'^(\w+\.)+\w+$')
+    request_classes = {}
 
     def validate(func):
         """ Decorator to check if request_uri
@@ -106,17 +140,23 @@ class Factory(object):
             return func(self, request_uri.lower(), **kwargs)
         return wrapper
 
-    @validate
     def __call__(self, request_uri, **kwargs):
+        try:
+            request_class = Factory.request_classes[request_uri]
+        except KeyError:
+            request_class = self.resolve(request_uri)
+            Factory.request_classes[request_uri] = request_class
+        return request_class(**kwargs)
+
+    @validate
+    def resolve(self, request_uri):
+        """ Request class of 'from.path.module.class' """
         module_chunk, s, request_chunk = request_uri.rpartition('.')
         request_chunk = request_chunk.capitalize()
         try:
             #  TODO: CamelCase and under_score support, now only Class Name
             module = import_module('%s.%s' % (ABS_IMPORT_PREFIX, module_chunk))
             request_class = getattr(module, request_chunk)
-            request = request_class(**kwargs)
-            assert isinstance(request, Request)
-            return request
         except ImportError:
             raise RequestDoesNotExist("'%s' module does not exist"
                                       % module_chunk)
@@ -124,3 +164,24 @@ class Factory(object):
             raise RequestDoesNotExist("'%s' request does not exist in "
                                       "'%s' module" % (request_chunk,
                                       module_chunk))
+        assert issubclass(request_class, Request)
+        return request_class
+
+    @classmethod
+    def preload(cls):
+        """ Import all the request modules and cache their classes.
+        Call it at startup to avoid resolving them in the first calls """
+        package = import_module(ABS_IMPORT_PREFIX)
+        modules = pkgutil.walk_packages(package.__path__,
+                                        '%s.' % ABS_IMPORT_PREFIX)
+        for importer, module_uri, is_package in modules:
+            if module_uri == __name__:
+                continue
+            module = import_module(module_uri)
+            module_chunk = module_uri[len(ABS_IMPORT_PREFIX) + 1:]
+            for name, value in vars(module).items():
+                if (isinstance(value, type) and issubclass(value, Request)
+                   and value.__module__ == module_uri):
+                    cls.request_classes['%s.%s' % (
+                        module_chunk, name.lower())] = value
+                    compile_uri(value.uri)
@@ -3,20 +3,90 @@
 from pygithub3.core import json
 
 
+def load_compact(resource, attrs):
+    """ Compact instance of ``resource`` (to unpickle them) """
+    return resource._get_compact_class()(attrs)
+
+
+class Compact(object):
+    """ Base of the ``__slots__`` classes of compact resources. Their
+    ``_resource`` is the resource class they're built from """
+
+    __slots__ = ()
+
+    def __init__(self, attrs):
+        for attr in self.__slots__:
+            if attr in attrs:
+                setattr(self, attr, attrs[attr])
+
+    def __reduce__(self):
+        attrs = dict([(attr, getattr(self, attr)) for attr in self.__slots__
+                      if hasattr(self, attr)])
+        return (load_compact, (self._resource, attrs))
+
+    def __str__(self):
+        return "<%s>" % self.__class__.__name__
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class ResourceType(type):
+    """ Compact instances of a resource are instances of it too """
+
+    def __instancecheck__(self, instance):
+        resource = getattr(type(instance), '_resource', None)
+        if resource is not None and issubclass(resource, self):
+            return True
+        return type.__instancecheck__(self, instance)
+
+
 class Resource(object):
 
+    __metaclass__ = ResourceType
+
     _dates = ()
     _maps = {}
     _collection_maps = {}
+    _fields = ()
+
+    # Reuse one instance for the repeated resources (same ``id`` or ``url``)
+    # of a decoded json. See ``Resource.loads``
+    _interned = False
+
+    # Only parse the ``_dates`` attributes. Disable it to parse every
+    # date-like string of the json (also in unmapped nested dicts)
+    schema_dates = True
+
+    # Keep the json dict and build each attribute (nested resources, dates)
+    # on its first access
+    lazy = False
+
+    # Build instances with only the ``_fields`` attributes, stored in
+    # ``__slots__`` (no ``__dict__`` nor ``_attrs``). Resources without
+    # ``_fields`` ignore it
+    compact = False
 
     def __init__(self, attrs):
         self._attrs = attrs
-        self.__set_attrs()
+        if not self.lazy:
+            self.__set_attrs()
 
     def __set_attrs(self):
         for attr in self._attrs:
             setattr(self, attr, self._attrs[attr])
 
+    def __getattr__(self, name):
+        """ Build and memoize the attributes of lazy resources """
+        attrs = self.__dict__.get('_attrs')
+        if attrs is None or name not in attrs:
+            raise AttributeError("'%s' object has no attribute '%s'" % (
+                                 self.__class__.__name__, name))
+        value = self.__parse(name, attrs[name],
+                             self.__dict__.get('_identities'))
+        setattr(self, name, value)
+        return value
+
     def __str__(self):
         return "<%s>" % self.__class__.__name__
 
@@ -24,56 +94,123 @@ class Resource(object):
         return self.__str__()
 
     @classmethod
-    def loads(self, json_content):
-        resource_chunk = json.loads(json_content)
+    def loads(self, json_content, identities=None):
+        """ Resource(s) of a json
+
+        :param dict identities: Identity map of interned resources, to share
+                                them between several decodes (e.g pages of a
+                                result). By default each decode has its own
+        """
+        if identities is None:
+            identities = {}
+        if self.schema_dates:
+            resource_chunk = json.loads(json_content, object_hook=None)
+        else:
+            resource_chunk = json.loads(json_content)
         if not hasattr(resource_chunk, 'items'):
-            return [self.__load(raw_resource)
+            return [self.__load(raw_resource, identities)
                     for raw_resource in resource_chunk]
         else:
-            return self.__load(resource_chunk)
+            return self.__load(resource_chunk, identities)
 
     @classmethod
-    def __load(self, raw_resource):
-        def self_resource(func):
-            def wrapper(resource, raw_resource):
-                if resource == 'self':
-                    resource = self
-                return func(resource, raw_resource)
-            return wrapper
-
-        @self_resource
-        def parse_map(resource, raw_resource):
-            if hasattr(raw_resource, 'items'):
-                return resource.__load(raw_resource)
-
-        @self_resource
-        def parse_collection_map(resource, raw_resources):
-            # Dict of resources (Ex: Gist file)
-            if hasattr(raw_resources, 'items'):
-                dict_map = {}
-                for key, raw_resource in raw_resources.items():
-                    dict_map[key] = resource.__load(raw_resource)
-                return dict_map
-            # list of resources
-            elif hasattr(raw_resources, '__iter__'):
-                return [resource.__load(raw_resource)
-                        for raw_resource in raw_resources]
+    def _get_compact_class(self):
+        """ ``__slots__`` class with the same declarations and methods, named
+        ``Compact<Resource>`` """
+        if '_compact_class' not in self.__dict__:
+            attrs = dict([(name, value) for name, value in vars(self).items()
+                          if name not in ('__dict__', '__weakref__')])
+            attrs['__slots__'] = tuple(self._fields)
+            attrs['_resource'] = self
+            self._compact_class = type('Compact%s' % self.__name__,
+                                       (Compact, ), attrs)
+        return self._compact_class
 
-        new_resource = raw_resource.copy()
-        new_resource.update(dict([
-            (attr, parse_map(resource, raw_resource[attr]))
-             for attr, resource in self._maps.items()
-             if attr in raw_resource]))
-        new_resource.update(dict([
-            (attr, parse_collection_map(resource, raw_resource[attr]))
-             for attr, resource in self._collection_maps.items()
-             if attr in raw_resource]))
+    @classmethod
+    def __load(self, raw_resource, identities=None):
+        if self._interned and identities is not None:
+            key = raw_resource.get('id') or raw_resource.get('url')
+            if key is not None:
+                key = (self, key)
+                if key not in identities:
+                    identities[key] = self.__build(raw_resource, identities)
+                return identities[key]
+        return self.__build(raw_resource, identities)
 
+    @classmethod
+    def __build(self, raw_resource, identities=None):
+        compact = self.compact and self._fields
+        if self.lazy and not compact:
+            resource = self(raw_resource)
+            if identities is not None:
+                resource._identities = identities
+            return resource
+        new_resource = raw_resource.copy()
+        for attrs in (self._dates, self._maps, self._collection_maps):
+            for attr in attrs:
+                if attr in raw_resource:
+                    new_resource[attr] = self.__parse(
+                        attr, raw_resource[attr], identities)
+        if compact:
+            return self._get_compact_class()(new_resource)
         return self(new_resource)
 
+    @classmethod
+    def __parse(self, attr, value, identities=None):
+        """ Resource(s) of mapped attributes and datetime of dates """
+        if attr in self._maps:
+            resource = self._maps[attr]
+            if resource == 'self':
+                resource = self
+            if hasattr(value, 'items'):
+                return resource.__load(value, identities)
+            return None
+        if attr in self._collection_maps:
+            resource = self._collection_maps[attr]
+            if resource == 'self':
+                resource = self
+            # Dict of resources (Ex: Gist file)
+            if hasattr(value, 'items'):
+                return dict([(key, resource.__load(raw_resource, identities))
+                             for key, raw_resource in value.items()])
+            # list of resources
+            elif hasattr(value, '__iter__'):
+                return [resource.__load(raw_resource, identities)
+                        for raw_resource in value]
+            return None
+        if attr in self._dates:
+            date = json.parse_date(value)
+            if date is not None:
+                return date
+        return value
+
 
 class Raw(Resource):
 
     @classmethod
-    def loads(self, json_content):
+    def loads(self, json_content, identities=None):
         return json.loads(json_content)
+
+
+class Json(Resource):
+    """ Plain json (dicts and lists), without resources nor dates """
+
+    @classmethod
+    def loads(self, json_content, identities=None):
+        return json.loads(json_content, object_hook=None)
+
+
+class Undecoded(Resource):
+    """ Json content as is """
+
+    @classmethod
+    def loads(self, json_content, identities=None):
+        return json_content
+
+
+class UndecodedPage(Resource):
+    """ Json content of a page as is, as its only item """
+
+    @classmethod
+    def loads(self, json_content, identities=None):
+        return [json_content]
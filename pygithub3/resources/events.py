@@ -8,6 +8,8 @@ class Event(Resource):
 
     _dates = ('created_at', )
     _maps = {'actor': users.User, 'repo': repos.Repo, 'org': orgs.Org}
+    _fields = ('id', 'type', 'public', 'payload', 'repo', 'actor', 'org',
+               'created_at')
 
     def __str__(self):
         return '<(%s)>' % getattr(self, 'type', '')
@@ -17,6 +19,8 @@ class Repo(Resource):
 
     _dates = ('created_at', )
     _maps = {'actor': users.User, 'repo': repos.Repo, 'org': orgs.Org}
+    _fields = ('id', 'type', 'public', 'payload', 'repo', 'actor', 'org',
+               'created_at')
 
     def __str__(self):
         return '<(%s)>' % getattr(self, 'type', '')
@@ -26,6 +30,8 @@ class Network(Resource):
 
     _dates = ('created_at', )
     _maps = {'actor': users.User, 'repo': repos.Repo, 'org': orgs.Org}
+    _fields = ('id', 'type', 'public', 'payload', 'repo', 'actor', 'org',
+               'created_at')
 
     def __str__(self):
         return '<(%s)>' % getattr(self, 'type', '')
@@ -35,6 +41,8 @@ class Org(Resource):
 
     _dates = ('created_at', )
     _maps = {'actor': users.User, 'repo': repos.Repo, 'org': orgs.Org}
+    _fields = ('id', 'type', 'public', 'payload', 'repo', 'actor', 'org',
+               'created_at')
 
     def __str__(self):
         return '<(%s)>' % getattr(self, 'type', '')
@@ -44,6 +52,8 @@ class User(Resource):
 
     _dates = ('created_at', )
     _maps = {'actor': users.User, 'repo': repos.Repo, 'org': orgs.Org}
+    _fields = ('id', 'type', 'public', 'payload', 'repo', 'actor', 'org',
+               'created_at')
 
     def __str__(self):
         return '<(%s)>' % getattr(self, 'type', '')
@@ -12,7 +12,7 @@ class File(Resource):
 
 class Fork(Resource):
 
-    _dates = ('created_at', )
+    _dates = ('created_at', 'updated_at')
     _maps = {'user': User}
 
     def __str__(self):
@@ -30,7 +30,7 @@ class History(Resource):
 
 class Gist(Resource):
 
-    _dates = ('created_at', )
+    _dates = ('created_at', 'updated_at')
     _maps = {'user': User}
     _collection_maps = {'files': File, 'forks': Fork, 'history': History}
 
@@ -42,6 +42,10 @@ class Issue(Resource):
     }
 
     _collection_maps = {'labels': Label}
+    _fields = ('id', 'url', 'html_url', 'number', 'state', 'title', 'body',
+               'body_text', 'body_html', 'user', 'labels', 'assignee',
+               'milestone', 'comments', 'pull_request', 'closed_at',
+               'closed_by', 'created_at', 'updated_at')
 
     def __str__(self):
         return '<Issue (%s)>' % getattr(self, 'number', '')
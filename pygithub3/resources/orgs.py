@@ -11,6 +11,7 @@ class Org(Resource):
 
     _dates = ('created_at', )
     _maps = {'plan': Plan}
+    _interned = True
 
     def __str__(self):
         return '<Org (%s)>' % getattr(self, 'login', '')
@@ -13,6 +13,15 @@ class Repo(Resource):
     _dates = ('created_at', 'updated_at', 'pushed_at')
     _maps = {'owner': User, 'organization': Org, 'parent': 'self',
              'source': 'self'}
+    _interned = True
+    _fields = ('url', 'html_url', 'clone_url', 'git_url', 'ssh_url',
+               'svn_url', 'mirror_url', 'id', 'owner', 'name', 'full_name',
+               'description', 'homepage', 'language', 'private', 'fork',
+               'forks', 'forks_count', 'watchers', 'watchers_count', 'size',
+               'master_branch', 'default_branch', 'open_issues',
+               'open_issues_count', 'pushed_at', 'created_at', 'updated_at',
+               'organization', 'parent', 'source', 'has_issues', 'has_wiki',
+               'has_downloads', 'permissions')
 
     def __str__(self):
         return '<Repo (%s)>' % getattr(self, 'name', '')
@@ -20,7 +29,7 @@ class Repo(Resource):
 
 class Author(Resource):
 
-    _dates = ('date')
+    _dates = ('date', )
 
     def __str__(self):
         return '<Author (%s)>' % getattr(self, 'name', '')
@@ -28,7 +37,7 @@ class Author(Resource):
 
 class Committer(Resource):
 
-    _dates = ('date')
+    _dates = ('date', )
 
     def __str__(self):
         return '<Committer (%s)>' % getattr(self, 'name', '')
@@ -58,6 +67,8 @@ class GitCommit(Resource):
     _maps = {'author': User, 'committer': User, 'commit': Commit,
              'stats': Stats}
     _collection_maps = {'parents': 'self', 'files': File}
+    _fields = ('url', 'sha', 'commit', 'author', 'committer', 'parents',
+               'stats', 'files')
 
     def __str__(self):
         return '<GitCommit (%s)>' % getattr(self, 'sha', '')
@@ -99,6 +110,8 @@ class Branch(Resource):
 
 class Download(Resource):
 
+    _dates = ('created_at', )
+
     def __str__(self):
         return '<Download (%s)>' % getattr(self, 'name', '')
 
@@ -112,7 +125,7 @@ class Download(Resource):
 
 class Hook(Resource):
 
-    _dates = ('created_at', 'pushed_at')
+    _dates = ('created_at', 'updated_at', 'pushed_at')
 
     def __str__(self):
         return '<Hook (%s)>' % getattr(self, 'name', '')
@@ -23,6 +23,13 @@ class User(Resource):
 
     _maps = {'plan': Plan}
     _dates = ('created_at', )
+    _interned = True
+    _fields = ('login', 'id', 'avatar_url', 'gravatar_id', 'url', 'name',
+               'company', 'blog', 'location', 'email', 'hireable', 'bio',
+               'public_repos', 'public_gists', 'followers', 'following',
+               'html_url', 'created_at', 'type', 'total_private_repos',
+               'owned_private_repos', 'private_gists', 'disk_usage',
+               'collaborators', 'plan')
 
     def __str__(self):
         return '<User (%s)>' % getattr(self, 'login', '')
@@ -1,9 +1,18 @@
 # -*- encoding: utf-8 -*-
 
+import functools
+import inspect
+import re
+import zlib
+
 from pygithub3.core.client import Client
 from pygithub3.core.errors import NotFound
+from pygithub3.core.executor import Executor
 from pygithub3.core.result import smart, normal
 from pygithub3.requests.base import Factory
+from pygithub3.resources.base import Json, Undecoded, UndecodedPage
+
+SHA_PATTERN = re.compile(r'^[0-9a-fA-F]{40}$')
 
 
 class Service(object):
@@ -15,10 +24,37 @@ class Service(object):
     :param str user: Default username in requests
     :param str repo: Default repository in requests
     :param str token: Token to OAuth
+    :param list tokens: Tokens to rotate. Each request uses the one with the
+                        most remaining requests
     :param int per_page: Items in each page of multiple returns
     :param str base_url: To support another github-related API (untested)
     :param stream verbose: Stream to write debug logs
     :param timeout float: Timeout for requests
+    :param int pool_connections: Number of hosts to keep connection pools for
+    :param int pool_maxsize: Keep-alive connections per host
+    :param bool pool_block: Wait for a free pooled connection
+    :param transport: :class:`~pygithub3.core.transport.Transport` to share
+                      the connection pool with other services
+    :param cache: :class:`~pygithub3.core.cache.Cache` to send conditional
+                  requests
+    :param ratelimit: :class:`~pygithub3.core.ratelimit.RateLimiter` to
+                      track the rate limit of each credential and pace the
+                      requests
+    :param retry: :class:`~pygithub3.core.retry.Retry` policy of transient
+                  failures. By default idempotent requests are tried 3 times
+    :param objects: :class:`~pygithub3.core.cache.Cache` (without ``ttl``)
+                    of git objects (blobs, trees, commits and tags) got by
+                    sha. They never change, so they're only requested once
+    :param int prefetch_workers: Fetch the pages of each :doc:`result`
+                                 concurrently (if it supports it)
+    :param int read_ahead: Pages to fetch in background of each
+                           :doc:`result` which follows the ``next`` links
+    :param str decode: ``json`` to return plain dicts and lists instead of
+                      resources, ``raw`` to return the json content as is
+                      (the content of each page in results). See
+                      :meth:`set_decode`
+    :param int max_cached_pages: Consumed pages to keep in memory of each
+                                 :doc:`result` (all by default)
 
     You can configure the **authentication** with BasicAuthentication (login
     and password) and with `OAuth <http://developer.github.com/v3/oauth/>`_ (
@@ -35,15 +71,36 @@ class Service(object):
 
     You can configure ``verbose`` logging like `requests library <http://docs.
     python-requests.org/en/v0.10.6/user/advanced/#verbose-logging>`_
+
+    Services built from the same :doc:`github` share one ``transport``, so
+    they reuse the connections to the API
+
+    With a ``cache`` each GET request sends the ``ETag`` and
+    ``Last-Modified`` of the last response and the cached body is served if
+    Github returns ``304 - Not modified``, which doesn't count for the rate
+    limit. See :class:`~pygithub3.core.cache.MemoryCache` and
+    :class:`~pygithub3.core.cache.SqliteCache`
     """
 
+    DECODES = ('resources', 'json', 'raw')
+
     def __init__(self, **config):
         self._client = Client(**config)
         self.request_builder = Factory()
 
     @property
     def remaining_requests(self):
-        return Client.remaining_requests
+        """ Remaining requests of the credential until the reset """
+        return self._client.remaining_requests
+
+    def set_decode(self, decode):
+        """ Set how the responses are decoded
+
+        :param str decode: ``resources`` (default), ``json`` or ``raw``
+        """
+        if decode not in self.DECODES:
+            raise ValueError("'%s' isn't one of %s" % (decode, self.DECODES))
+        self._client.config['decode'] = decode
 
     def get_user(self):
         return self._client.user
@@ -80,6 +137,21 @@ class Service(object):
         """
         self._client.set_token(token)
 
+    def deferred(self, workers=4):
+        """ Service whose calls return futures. See :class:`Deferred`
+
+        :param int workers: Calls in flight at the same time
+        """
+        return Deferred(self, Executor(workers))
+
+    def batch(self, workers=4):
+        """ Service which queues its calls to run them concurrently. See
+        :class:`Batch`
+
+        :param int workers: Calls in flight at the same time
+        """
+        return Batch(self, Executor(workers))
+
     #TODO: Refact as decorator::
     """
         Reason: make_request and request_builder ... are confusing names
@@ -103,12 +175,12 @@ class Service(object):
         except NotFound:
             return False
 
-    def _patch(self, request, **kwargs):
+    def _patch(self, request, decode=True, **kwargs):
         input_data = request.get_body()
         response = self._client.patch(request, data=input_data, **kwargs)
-        return request.resource.loads(response.content)
+        return self.__resource(request, decode=decode).loads(response.content)
 
-    def _put(self, request, **kwargs):
+    def _put(self, request, decode=True, **kwargs):
         """ Bug in Github API? requests library?
 
         I must send data when the specifications' of some PUT request are 'Not
@@ -128,28 +200,213 @@ class Service(object):
         input_data = request.get_body() or 'PLACEHOLDER'
         response = self._client.put(request, data=input_data, **kwargs)
         if response.status_code != 204:  # != NO_CONTENT
-            return request.resource.loads(response.content)
+            return self.__resource(request, decode=decode).loads(
+                response.content)
 
     def _delete(self, request, **kwargs):
         input_data = request.get_body()
         self._client.delete(request, data=input_data, **kwargs)
 
-    def _post(self, request, **kwargs):
+    def _post(self, request, decode=True, **kwargs):
         input_data = request.get_body()
         response = self._client.post(request, data=input_data, **kwargs)
-        return request.resource.loads(response.content)
+        return self.__resource(request, decode=decode).loads(response.content)
 
-    def _get(self, request, **kwargs):
+    def _get(self, request, decode=True, **kwargs):
         response = self._client.get(request, **kwargs)
-        return request.resource.loads(response.content)
+        return self.__resource(request, decode=decode).loads(response.content)
+
+    def _get_object(self, request, sha, decode=True, **kwargs):
+        """ ``_get`` of a git object, through the ``objects`` cache if
+        ``sha`` is a full sha (not a ref, which can change) """
+        objects = self._client.config.get('objects')
+        if objects is None or not SHA_PATTERN.match(sha or ''):
+            return self._get(request, decode=decode, **kwargs)
+        params = dict([(name, value) for name, value in kwargs.items()
+                       if name != 'headers'])
+        accept = kwargs.get('headers', {}).get('Accept')
+        key = objects.key(self._client.config['base_url'] + str(request),
+                          params, accept)
+        content = objects.get(key)
+        if content is None:
+            content = self._client.get(request, **kwargs).content
+            objects.set(key, zlib.compress(content))
+        else:
+            content = zlib.decompress(content)
+        return self.__resource(request, decode=decode).loads(content)
+
+    def __resource(self, request, page=False, decode=True):
+        """ Resource to load the responses of ``request`` with. Without
+        ``decode`` it ignores the ``decode`` config (for the internal calls
+        which read the resources) """
+        decode = decode and self._client.config.get('decode')
+        if decode == 'json':
+            return Json
+        if decode == 'raw':
+            return page and UndecodedPage or Undecoded
+        return request.resource
 
     def _get_result(self, request, **kwargs):
         method = smart.Method(self._client.get, request, **kwargs)
-        return smart.Result(method)
+        method.resource = self.__resource(request, page=True)
+        result = smart.Result(method)
+        workers = self._client.config.get('prefetch_workers')
+        if workers:
+            result.prefetch(workers)
+        return self.__stream(result)
 
     def _get_normal_result(self, request, **kwargs):
         method = normal.Method(self._client.get, request, **kwargs)
-        return normal.Result(method)
+        method.resource = self.__resource(request, page=True)
+        method.session_params = self._client.requester.params
+        result = normal.Result(method)
+        pages = self._client.config.get('read_ahead')
+        if pages:
+            result.read_ahead(pages)
+        return self.__stream(result)
+
+    def __stream(self, result):
+        pages = self._client.config.get('max_cached_pages')
+        if pages:
+            result.stream(pages)
+        return result
+
+
+class Deferred(object):
+    """
+    Proxy of a service (or :doc:`github`) whose calls run concurrently in an
+    :class:`~pygithub3.core.executor.Executor` and return futures. Its
+    sub-services are deferred too, and its ``synchronous`` methods (e.g
+    ``set_user``) are called in place
+
+    ::
+
+        with gh.deferred(workers=8) as deferred:
+            futures = [deferred.repos.get(user='octocat', repo=repo)
+                       for repo in repos]
+            repos = [future.get() for future in futures]
+
+    .. note::
+        Requests which return a :doc:`result` are lazy, so submit its ``all``
+        to fetch the pages in background::
+
+            result = gh.issues.list_by_repo('octocat', 'Hello-World')
+            future = deferred.executor.submit(result.all)
+
+    .. note::
+        The default ``user`` and ``repo`` of a call are the service ones
+        when it's submitted (e.g ``deferred.repos.set_repo`` doesn't change
+        the queued calls), but the rest of config (e.g the token or the
+        mimetype) is read when it runs
+    """
+
+    #: Methods which don't issue requests, so they're called synchronously
+    synchronous = ('get_user', 'set_user', 'get_repo', 'set_repo',
+                   'set_credentials', 'set_token', 'set_decode',
+                   'make_request', 'deferred', 'batch', 'set_raw', 'set_text',
+                   'set_html', 'set_full', '_get_mimetype_as_header')
+
+    def __init__(self, service, executor):
+        self.service = service
+        self.executor = executor
+
+    def __getattr__(self, name):
+        attr = getattr(self.service, name)
+        if isinstance(attr, Service):
+            return self._proxy(attr)
+        if callable(attr) and name not in self.synchronous:
+            return functools.partial(self.__submit_call, attr)
+        return attr
+
+    def __submit_call(self, func, *args, **kwargs):
+        """ Submit a service call with its default user and repo """
+        if isinstance(self.service, Service) and inspect.ismethod(func):
+            names = inspect.getargspec(func).args[1:]
+            callargs = inspect.getcallargs(func, *args, **kwargs)
+            defaults = dict(user=self.service.get_user(),
+                            repo=self.service.get_repo())
+            args = list(args)
+            for name, default in defaults.items():
+                if name not in names or callargs[name] is not None:
+                    continue
+                if names.index(name) < len(args):
+                    args[names.index(name)] = default
+                else:
+                    kwargs[name] = default
+        return self.submit(func, *args, **kwargs)
+
+    def _proxy(self, service):
+        return Deferred(service, self.executor)
+
+    def submit(self, func, *args, **kwargs):
+        """ Run a call in the executor
+
+        :returns: Future of its result
+        """
+        return self.executor.submit(func, *args, **kwargs)
+
+    def close(self):
+        """ Wait for the pending calls and stop the executor """
+        self.executor.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class Batch(Deferred):
+    """
+    :class:`Deferred` service (or :doc:`github`) which queues its calls and
+    its sub-services calls, to collect them in submission order. A failed
+    call doesn't stop the others, its exception is returned in its place
+
+    ::
+
+        with gh.batch(workers=8) as batch:
+            for repo in repos:
+                batch.repos.get(user='octocat', repo=repo)
+            for login in logins:
+                batch.orgs.members.is_member('github', login)
+        repos_and_memberships = batch.results()
+
+    The calls share the connection pool and the rate limiter of the service,
+    so a ``RateLimiter(pace=True, wait=True)`` spreads them over the rate
+    limit instead of failing them with
+    :class:`~pygithub3.exceptions.RateLimitExceeded`
+    """
+
+    def __init__(self, service, executor, futures=None):
+        super(Batch, self).__init__(service, executor)
+        self.futures = [] if futures is None else futures
+
+    def _proxy(self, service):
+        return Batch(service, self.executor, self.futures)
+
+    @staticmethod
+    def __call(func, args, kwargs):
+        try:
+            return func(*args, **kwargs)
+        except Exception as error:
+            return error
+
+    def submit(self, func, *args, **kwargs):
+        """ Queue a call
+
+        :returns: Future of its result (or its exception)
+        """
+        future = self.executor.submit(self.__call, func, args, kwargs)
+        self.futures.append(future)
+        return future
+
+    def results(self):
+        """ Wait for the queued calls
+
+        :returns: List with the result or exception of each call, in
+                  submission order
+        """
+        return [future.get() for future in list(self.futures)]
 
 
 # XXX: Refact to set_<type> method
@@ -162,9 +419,11 @@ class MimeTypeMixin(object):
 
     VERSION = 'beta'
 
+    def __mimetype(self, mimetype):
+        return 'application/vnd.github.%s.%s+json' % (self.VERSION, mimetype)
+
     def __set_mimetype(self, mimetype):
-        self.mimetype = 'application/vnd.github.%s.%s+json' % (
-            self.VERSION, mimetype)
+        self.mimetype = self.__mimetype(mimetype)
 
     def set_raw(self):
         """ Resource will have ``body`` attribute """
@@ -183,7 +442,10 @@ class MimeTypeMixin(object):
         attributes """
         self.__set_mimetype('full')
 
-    def _get_mimetype_as_header(self):
+    def _get_mimetype_as_header(self, mimetype=None):
+        """ Accept header of the service mimetype (or of ``mimetype``) """
+        if mimetype is not None:
+            return {'headers': {'Accept': self.__mimetype(mimetype)}}
         try:
             return {'headers': {'Accept': self.mimetype}}
         except AttributeError:
@@ -1,11 +1,17 @@
 # -*- encoding: utf-8 -*-
 
+from base64 import b64encode
+
+from pygithub3.core.executor import Executor
 from pygithub3.services.base import Service
-from .blobs import Blobs
+from .blobs import Blobs, blob_sha
 from .commits import Commits
 from .references import References
 from .tags import Tags
-from .trees import Trees
+from .trees import Trees, TREE_MODE, SUBMODULE_MODE
+
+INLINE_SIZE = 64 * 1024
+FILE_MODE = '100644'
 
 
 class GitData(Service):
@@ -18,3 +24,104 @@ class GitData(Service):
         self.tags = Tags(**config)
         self.trees = Trees(**config)
         super(GitData, self).__init__(**config)
+
+    def commit_files(self, files, message, branch='master', workers=4,
+                     inline_size=INLINE_SIZE, author=None, committer=None,
+                     user=None, repo=None):
+        """ Commit files to a branch with the fewest requests
+
+        :param dict files: Content of each path (str or unicode)
+        :param str message: Commit message
+        :param str branch: Branch to commit to
+        :param int workers: Blobs uploaded at the same time
+        :param int inline_size: Text files up to this size go inline in the
+                                tree, without creating their blobs
+        :param dict author: Author of the commit. See `github commits doc`_
+        :param dict committer: Committer of the commit
+        :param str user: Username
+        :param str repo: Repository
+        :returns: The new commit (a resource, whatever the ``decode``
+                  config), or None if the files didn't change
+
+        It computes the blob sha of each file, so unchanged files are
+        skipped and contents which are already in the branch tree aren't
+        uploaded again. Changed files keep their mode (e.g executables) and
+        new ones are regular files. The rest of blobs are uploaded
+        concurrently, then it creates the tree (over the branch tree), the
+        commit and updates the branch
+        ::
+
+            git_data.commit_files({'README': 'Hello', 'src/app.py': source},
+                                  'Update app', branch='develop',
+                                  user='octocat', repo='Hello-World')
+
+        .. note::
+            Remember :ref:`config precedence`
+        """
+        ref = 'heads/%s' % branch
+        request = self.make_request('git_data.references.get', ref=ref,
+            user=user, repo=repo)
+        head = self._get(request, decode=False).object['sha']
+        request = self.make_request('git_data.commits.get', sha=head,
+            user=user, repo=repo)
+        base_tree = self._get_object(request, head, decode=False).tree['sha']
+        existing = dict([(path, (mode, sha)) for path, mode, sha in
+                         self.trees.entries(base_tree, user=user, repo=repo)
+                         if mode not in (TREE_MODE, SUBMODULE_MODE)])
+        shas = set([sha for mode, sha in existing.values()])
+        entries, uploads = [], []
+        for path, content in sorted(files.items()):
+            if isinstance(content, unicode):
+                content = content.encode('utf-8')
+            sha = blob_sha(content)
+            mode, existing_sha = existing.get(path, (FILE_MODE, None))
+            if existing_sha == sha:
+                continue
+            entry = dict(path=path, mode=mode, type='blob')
+            if sha in shas:
+                entry['sha'] = sha
+            elif len(content) <= inline_size and self.__is_text(content):
+                entry['content'] = content.decode('utf-8')
+            else:
+                uploads.append((entry, content))
+            entries.append(entry)
+        if not entries:
+            return None
+        if uploads:
+            with Executor(min(workers, len(uploads))) as executor:
+                futures = [executor.submit(
+                    self.__post, 'git_data.blobs.create',
+                    dict(content=b64encode(content), encoding='base64'),
+                    user, repo) for entry, content in uploads]
+                for (entry, content), future in zip(uploads, futures):
+                    entry['sha'] = future.get().sha
+        new_tree = self.__post('git_data.trees.create',
+                               dict(tree=entries, base_tree=base_tree),
+                               user, repo)
+        data = dict(message=message, tree=new_tree.sha, parents=[head])
+        if author:
+            data['author'] = author
+        if committer:
+            data['committer'] = committer
+        commit = self.__post('git_data.commits.create', data, user, repo)
+        request = self.make_request('git_data.references.update', ref=ref,
+            body=dict(sha=commit.sha), user=user, repo=repo)
+        self._patch(request, decode=False)
+        return commit
+
+    def __post(self, request_name, data, user, repo):
+        """ Create a git object, loading its resource whatever the
+        ``decode`` config """
+        request = self.make_request(request_name, body=data, user=user,
+            repo=repo)
+        return self._post(request, decode=False)
+
+    @staticmethod
+    def __is_text(content):
+        if '\0' in content:
+            return False
+        try:
+            content.decode('utf-8')
+        except UnicodeDecodeError:
+            return False
+        return True
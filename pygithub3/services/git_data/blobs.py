@@ -1,8 +1,19 @@
 #!/usr/bin/env python
 # -*- encoding: utf-8 -*-
 
+import hashlib
+
 from pygithub3.services.base import Service, MimeTypeMixin
 
+CHUNK_SIZE = 64 * 1024
+
+
+def blob_sha(content):
+    """ Git sha of a blob with ``content`` """
+    digest = hashlib.sha1('blob %d\0' % len(content))
+    digest.update(content)
+    return digest.hexdigest()
+
 
 class Blobs(Service, MimeTypeMixin):
     """Consume `Blobs API <http://developer.github.com/v3/git/blobs/>`_"""
@@ -19,7 +30,79 @@ class Blobs(Service, MimeTypeMixin):
         """
         request = self.make_request('git_data.blobs.get', sha=sha,
             user=user, repo=repo)
-        return self._get(request, **self._get_mimetype_as_header())
+        return self._get_object(request, sha,
+                                **self._get_mimetype_as_header())
+
+    def iter_content(self, sha, chunk_size=CHUNK_SIZE, verify=True,
+                     size=None, user=None, repo=None):
+        """Generator of the raw content of a blob, in chunks
+
+        :param str sha: The sha of the blob to get
+        :param int chunk_size: Bytes of each chunk
+        :param bool verify: Check the git sha of the content while it's
+                            read. It raises ``ValueError`` after the last
+                            chunk if it doesn't match
+        :param int size: Bytes of the blob (e.g the ``size`` of its tree
+                         entry). By default the ``Content-Length`` of the
+                         response, which is needed to verify it
+        :param str user: Username
+        :param str repo: Repository
+
+        It requests the raw mimetype and it doesn't load the whole content
+        (nor its base64) in memory
+
+        .. note::
+            Remember :ref:`config precedence`
+        """
+        request = self.make_request('git_data.blobs.get', sha=sha,
+            user=user, repo=repo)
+        kwargs = self._get_mimetype_as_header('raw')
+        kwargs['headers']['Accept-Encoding'] = 'identity'
+        response = self._client.get(request, prefetch=False, **kwargs)
+        try:
+            if verify:
+                if size is None:
+                    size = response.headers.get('content-length')
+                if size is None:
+                    raise ValueError("Blob %s can't be verified without its "
+                                     "size" % sha)
+                digest = hashlib.sha1('blob %d\0' % int(size))
+            for chunk in response.iter_content(chunk_size):
+                if verify:
+                    digest.update(chunk)
+                yield chunk
+            if verify and digest.hexdigest() != sha:
+                raise ValueError('Blob %s content has sha %s' % (
+                                 sha, digest.hexdigest()))
+        finally:  # Stopped early or failed, the connection goes to the pool
+            response.raw.release_conn()
+
+    def stream(self, sha, fileobj, chunk_size=CHUNK_SIZE, verify=True,
+               size=None, user=None, repo=None):
+        """Write the raw content of a blob to a file, in chunks
+
+        :param str sha: The sha of the blob to get
+        :param fileobj: File-like object, or function called with each chunk
+        :returns: Bytes written
+
+        The rest of arguments are the same as in :meth:`iter_content`
+        ::
+
+            sha = '3a0f86fb8db8eea7ccbb9a95f325ddbedfb25e15'
+            with open('big.bin', 'wb') as fileobj:
+                blobs_service.stream(sha, fileobj, user='octocat',
+                                     repo='repo')
+
+        .. note::
+            Remember :ref:`config precedence`
+        """
+        write = getattr(fileobj, 'write', fileobj)
+        written = 0
+        for chunk in self.iter_content(sha, chunk_size, verify, size,
+                                       user=user, repo=repo):
+            write(chunk)
+            written += len(chunk)
+        return written
 
     def create(self, data, user=None, repo=None):
         """Create a blob
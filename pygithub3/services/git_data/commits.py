@@ -19,7 +19,7 @@ class Commits(Service):
         """
         request = self.make_request('git_data.commits.get', sha=sha,
             user=user, repo=repo)
-        return self._get(request)
+        return self._get_object(request, sha)
 
     def create(self, data, user=None, repo=None):
         """create a commit on a repo
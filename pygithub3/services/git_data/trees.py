@@ -1,8 +1,99 @@
 #!/usr/bin/env python
 # -*- encoding: utf-8 -*-
 
+from binascii import hexlify, unhexlify
+from bisect import bisect_left
+
 from pygithub3.services.base import Service
 
+TREE_MODE = '040000'
+SUBMODULE_MODE = '160000'
+
+
+class TreeIndex(object):
+    """ Compact index of a recursive tree: its paths sorted, with their modes
+    and shas (stored as 20 bytes)
+
+    :param str sha: Sha of the tree
+    :param entries: ``(path, mode, sha)`` of each entry, in any order
+
+    It can be saved to a file with :meth:`dump` and be the ``base`` of
+    :meth:`Trees.diff`
+    """
+
+    def __init__(self, sha, entries=()):
+        self.sha = sha
+        entries = sorted(entries)
+        self.paths = [path for path, mode, sha in entries]
+        self.modes = [intern(str(mode)) for path, mode, sha in entries]
+        self.shas = ''.join([unhexlify(sha) for path, mode, sha in entries])
+
+    def __entry(self, index):
+        return (self.paths[index], self.modes[index],
+                hexlify(self.shas[index * 20:index * 20 + 20]))
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __iter__(self):
+        """ ``(path, mode, sha)`` of each entry, sorted by path """
+        for index in xrange(len(self.paths)):
+            yield self.__entry(index)
+
+    def __contains__(self, path):
+        return self.get(path) is not None
+
+    def get(self, path):
+        """ ``(mode, sha)`` of the path or None """
+        index = bisect_left(self.paths, path)
+        if index < len(self.paths) and self.paths[index] == path:
+            return self.__entry(index)[1:]
+        return None
+
+    def under(self, prefix):
+        """ ``(path, mode, sha)`` of the entries under ``prefix``, a
+        directory ending with slash ('' is the root) """
+        index = bisect_left(self.paths, prefix)
+        while (index < len(self.paths) and
+               self.paths[index].startswith(prefix)):
+            yield self.__entry(index)
+            index += 1
+
+    def children(self, prefix):
+        """ ``{name: (mode, sha)}`` of the entries right in ``prefix``, a
+        directory ending with slash ('' is the root) """
+        children = {}
+        index = bisect_left(self.paths, prefix)
+        while (index < len(self.paths) and
+               self.paths[index].startswith(prefix)):
+            path, mode, sha = self.__entry(index)
+            name = path[len(prefix):]
+            if '/' in name:  # Skip the rest of this sub-tree ('0' > '/')
+                name = name[:name.index('/')]
+                index = bisect_left(self.paths, prefix + name + '0', index)
+                continue
+            children[name] = (mode, sha)
+            index += 1
+        return children
+
+    def dump(self, fileobj):
+        """ Write it to a file as ``mode sha\tpath`` lines, after the sha of
+        the tree """
+        fileobj.write('%s\n' % self.sha)
+        for path, mode, sha in self:
+            fileobj.write('%s %s\t%s\n' % (mode, sha, path.encode('utf-8')))
+
+    @classmethod
+    def load(cls, fileobj):
+        """ Read a tree index written by :meth:`dump` """
+        sha = fileobj.readline().strip()
+        entries = []
+        for line in fileobj:
+            attrs, path = line.rstrip('\n').split('\t', 1)
+            mode, entry_sha = attrs.split(' ')
+            entries.append((path.decode('utf-8'), mode, entry_sha))
+        return cls(sha, entries)
+
 
 class Trees(Service):
     """Consume `Trees API <http://developer.github.com/v3/git/trees/>`_"""
@@ -19,9 +110,15 @@ class Trees(Service):
         .. note::
             Remember :ref:`config precedence`
         """
+        return self._get_tree(sha, recursive, user, repo, decode=True)
+
+    def _get_tree(self, sha, recursive=False, user=None, repo=None,
+                  decode=False):
+        """ :meth:`get`, loading the tree resource by default """
         request = self.make_request('git_data.trees.get', sha=sha, user=user,
             repo=repo)
-        return self._get(request, recursive=recursive)
+        params = recursive and dict(recursive=1) or {}  # Any value recurses
+        return self._get_object(request, sha, decode=decode, **params)
 
     def create(self, data, user=None, repo=None):
         """ Create a tree object
@@ -36,3 +133,126 @@ class Trees(Service):
         request = self.make_request('git_data.trees.create', body=data,
             user=user, repo=repo)
         return self._post(request)
+
+    def entries(self, sha, prefix='', user=None, repo=None):
+        """ ``(path, mode, sha)`` of every entry of a tree (recursive)
+
+        :param str sha: The SHA of the tree
+        :param str prefix: Prefix of the paths
+        :param str user: Username
+        :param str repo: Repository
+
+        If the tree is too big to get it at once, it gets its sub-trees
+
+        .. note::
+            Remember :ref:`config precedence`
+        """
+        tree = self._get_tree(sha, recursive=True, user=user, repo=repo)
+        if not getattr(tree, 'truncated', False):
+            return [(prefix + entry['path'], entry['mode'], entry['sha'])
+                    for entry in tree.tree]
+        entries = []  # Too big to get it at once. Walk its sub-trees
+        for entry in self._get_tree(sha, user=user, repo=repo).tree:
+            path = prefix + entry['path']
+            entries.append((path, entry['mode'], entry['sha']))
+            if entry['mode'] == TREE_MODE:
+                entries.extend(self.entries(entry['sha'], path + '/',
+                                            user, repo))
+        return entries
+
+    def index(self, sha, user=None, repo=None):
+        """ Get a tree as a :class:`TreeIndex`
+
+        :param str sha: The SHA of the tree
+        :param str user: Username
+        :param str repo: Repository
+
+        .. note::
+            Remember :ref:`config precedence`
+        """
+        return TreeIndex(sha, self.entries(sha, user=user, repo=repo))
+
+    def diff(self, base, head, user=None, repo=None):
+        """ Generator of the changed files between two trees
+
+        :param base: SHA of the tree or its :class:`TreeIndex`
+        :param head: SHA of the tree or its :class:`TreeIndex`
+        :param str user: Username
+        :param str repo: Repository
+        :returns: ``(status, path, base_sha, head_sha)`` of each file, where
+                  status is ``added``, ``removed`` or ``modified``
+
+        It only requests the sub-trees whose SHAs differ (and none of an
+        index), so its cost is proportional to the changes
+        ::
+
+            index = trees_service.index(old_tree_sha)
+            for status, path, old, new in trees_service.diff(index, tree_sha):
+                print status, path
+
+        .. note::
+            Remember :ref:`config precedence`
+        """
+        base = _Side(self, base, user, repo)
+        head = _Side(self, head, user, repo)
+        return self.__diff(base, base.sha, head, head.sha, '')
+
+    def __diff(self, base, base_sha, head, head_sha, prefix):
+        if base_sha == head_sha:
+            return
+        base_children = base.children(base_sha, prefix)
+        head_children = head.children(head_sha, prefix)
+        for name in sorted(set(base_children) | set(head_children)):
+            path = prefix + name
+            old = base_children.get(name)
+            new = head_children.get(name)
+            if old == new:
+                continue
+            old_tree = old is not None and old[0] == TREE_MODE
+            new_tree = new is not None and new[0] == TREE_MODE
+            if old_tree and new_tree:
+                for change in self.__diff(base, old[1], head, new[1],
+                                          path + '/'):
+                    yield change
+                continue
+            if old is not None and new is not None and not (old_tree or
+                                                           new_tree):
+                yield ('modified', path, old[1], new[1])
+                continue
+            if old_tree:
+                for file_path, sha in base.files(old[1], path + '/'):
+                    yield ('removed', file_path, sha, None)
+            elif old is not None:
+                yield ('removed', path, old[1], None)
+            if new_tree:
+                for file_path, sha in head.files(new[1], path + '/'):
+                    yield ('added', file_path, None, sha)
+            elif new is not None:
+                yield ('added', path, None, new[1])
+
+
+class _Side(object):
+    """ Tree of a diff, from an index or requested """
+
+    def __init__(self, service, tree, user, repo):
+        self.service = service
+        self.index = tree if isinstance(tree, TreeIndex) else None
+        self.sha = tree.sha if self.index is not None else tree
+        self.user = user
+        self.repo = repo
+
+    def children(self, sha, prefix):
+        if self.index is not None:
+            return self.index.children(prefix)
+        tree = self.service._get_tree(sha, user=self.user, repo=self.repo)
+        return dict([(entry['path'], (entry['mode'], entry['sha']))
+                     for entry in tree.tree])
+
+    def files(self, sha, prefix):
+        if self.index is not None:
+            entries = self.index.under(prefix)
+        else:
+            entries = self.service.entries(sha, prefix, self.user,
+                                           self.repo)
+        return [(path, entry_sha) for path, mode, entry_sha in entries
+                if mode != TREE_MODE]
@@ -53,7 +53,7 @@ class Commits(Service, MimeTypeMixin):
         """
         request = self.make_request('repos.commits.get',
             sha=sha, user=user, repo=repo)
-        return self._get(request)
+        return self._get_object(request, sha)
 
     def list_comments(self, sha=None, user=None, repo=None):
         """ Get commit's comments
@@ -1,8 +1,12 @@
 #!/usr/bin/env python
 # -*- encoding: utf-8 -*-
 
+import os
+import time
+
 import requests
 
+from pygithub3.core.multipart import CHUNK_SIZE, MultipartStream, file_size
 from . import Service
 
 
@@ -64,21 +68,69 @@ class Downloads(Service):
 
             # Step 2
             download.upload('/home/user/file.ext')
+
+        The ``upload`` function has the arguments of :meth:`upload` but
+        ``download``. It always returns a ``Download`` resource, whatever the
+        ``decode`` config
         """
         request = self.make_request('repos.downloads.create',
             body=data, user=user, repo=repo)
-        download = self._post(request)
+        download = self._post(request, decode=False)
 
-        # TODO: improve it. e.g Manage all with file desc
-        def upload(file_path):
-            """ """
-            data = download.ball_to_upload()
-            files = {'File': open(file_path, 'rb')}
-            return requests.post(download.s3_url, data=data, files=files)
+        def upload(file, size=None, chunk_size=CHUNK_SIZE, progress=None):
+            """ Upload the file of the download. See
+            :meth:`~pygithub3.services.repos.Downloads.upload` """
+            return self.upload(download, file, size, chunk_size, progress)
 
         download.upload = upload
         return download
 
+    def upload(self, download, file, size=None, chunk_size=CHUNK_SIZE,
+               progress=None):
+        """ Upload the file of a created download
+
+        :param download: Download returned by :meth:`create`
+        :param file: File path, file-like object (e.g file, mmap) or iterator
+                     of chunks
+        :param int size: Bytes of the file. By default the size of the file,
+                         or the size of the download for iterators
+        :param int chunk_size: Bytes to read from the file each time
+        :param progress: Function called with the bytes sent and the total
+                         bytes while it uploads
+        :returns: The response of the upload, with the ``bytes`` sent and the
+                  ``seconds`` spent in its ``upload_stats``
+
+        It streams the file in chunks through the connection pool, so it
+        isn't loaded in memory. A file path is opened and closed here
+        ::
+
+            download.upload('/home/user/file.ext',
+                            progress=lambda sent, total: log(sent, total))
+        """
+        if isinstance(file, basestring):
+            fileobj = open(file, 'rb')
+            try:
+                return self.upload(download, fileobj, size, chunk_size,
+                                   progress)
+            finally:
+                fileobj.close()
+        if size is None:
+            size = file_size(file)
+        if size is None:
+            size = download.size
+        filename = os.path.basename(getattr(file, 'name', '') or
+                                    download.name)
+        body = MultipartStream(download.ball_to_upload(), 'File', file, size,
+                               filename, chunk_size, progress)
+        session = self._client.transport.attach(requests.session())
+        start = time.time()
+        response = session.post(download.s3_url, data=body, headers={
+            'Content-Type': body.content_type,
+            'Content-Length': str(len(body))})
+        response.upload_stats = dict(bytes=body.sent,
+                                     seconds=time.time() - start)
+        return response
+
     def delete(self, id, user=None, repo=None):
         """ Delete a download
 
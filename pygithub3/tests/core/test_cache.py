@@ -0,0 +1,127 @@
+# -*- encoding: utf-8 -*-
+
+import os
+import tempfile
+
+import requests
+from mock import patch
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+from pygithub3.core.cache import MemoryCache, SqliteCache
+from pygithub3.core.client import Client
+from pygithub3.tests.utils.core import TestCase
+
+
+def mock_cacheable_response(status_code=200, content='[]', **headers):
+    response = Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers = CaseInsensitiveDict(headers)
+    return response
+
+
+class CacheBackendMixin(object):
+
+    def test_GET_and_SET(self):
+        self.cache.set('key', dict(etag='"abc"'))
+        self.assertEqual(self.cache.get('key'), dict(etag='"abc"'))
+        self.assertIsNone(self.cache.get('fake'))
+
+    def test_LRU_eviction(self):
+        self.cache.max_entries = 2
+        self.cache.set('key1', 1)
+        self.cache.set('key2', 2)
+        self.cache.get('key1')
+        self.cache.set('key3', 3)
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNone(self.cache.get('key2'))
+        self.assertEqual(self.cache.get('key1'), 1)
+
+    @patch('pygithub3.core.cache.time')
+    def test_TTL_eviction(self, time):
+        self.cache.ttl = 60
+        time.time.return_value = 1000
+        self.cache.set('key', 1)
+        time.time.return_value = 1050
+        self.assertEqual(self.cache.get('key'), 1)
+        time.time.return_value = 1061
+        self.assertIsNone(self.cache.get('key'))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_clear(self):
+        self.cache.set('key', 1)
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+
+class TestMemoryCache(CacheBackendMixin, TestCase):
+
+    def setUp(self):
+        self.cache = MemoryCache()
+
+
+class TestSqliteCache(CacheBackendMixin, TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+        self.cache = SqliteCache(self.path)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_SHARED_between_instances(self):
+        self.cache.set('key', dict(content='[]'))
+        self.assertEqual(SqliteCache(self.path).get('key'),
+                         dict(content='[]'))
+
+
+@patch.object(requests.sessions.Session, 'request')
+class TestClientWithCache(TestCase):
+
+    def setUp(self):
+        self.cache = MemoryCache()
+        self.c = Client(cache=self.cache)
+
+    def test_STORE_and_send_conditional(self, request_method):
+        request_method.return_value = mock_cacheable_response(
+            etag='"abc"', link='<https://d.com/d?page=2>; rel="last"')
+        self.c.get('repos', arg1='arg1')
+        self.assertEqual(len(self.cache), 1)
+
+        request_method.return_value = mock_cacheable_response(304, '')
+        response = self.c.get('repos', arg1='arg1')
+        self.assertEqual(request_method.call_args[1]['headers'],
+                         {'If-None-Match': '"abc"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, '[]')
+        self.assertTrue(response.from_cache)
+        self.assertIn('rel="last"', response.headers['link'])
+
+    def test_KEY_depends_on_params_and_accept(self, request_method):
+        request_method.return_value = mock_cacheable_response(**{
+            'last-modified': 'Thu, 05 Jul 2012 15:31:30 GMT'})
+        self.c.get('repos', page=1)
+        self.c.get('repos', page=2)
+        self.c.get('repos', page=2, headers={'Accept': 'raw'})
+        self.assertEqual(len(self.cache), 3)
+        self.c.get('repos', page=2)
+        self.assertEqual(request_method.call_args[1]['headers'],
+            {'If-Modified-Since': 'Thu, 05 Jul 2012 15:31:30 GMT'})
+
+    def test_WITHOUT_validators_not_stored(self, request_method):
+        request_method.return_value = mock_cacheable_response()
+        self.c.get('repos')
+        self.assertEqual(len(self.cache), 0)
+
+    def test_ONLY_get_requests(self, request_method):
+        request_method.return_value = mock_cacheable_response(201,
+                                                              etag='"abc"')
+        self.c.post('repos')
+        self.assertEqual(len(self.cache), 0)
+
+    def test_NOT_streamed_requests(self, request_method):
+        request_method.return_value = mock_cacheable_response(etag='"abc"')
+        self.c.get('repos', prefetch=False)
+        self.assertEqual(len(self.cache), 0)
@@ -0,0 +1,34 @@
+# -*- encoding: utf-8 -*-
+
+import threading
+
+from pygithub3.core.executor import Executor
+from pygithub3.tests.utils.core import TestCase
+
+
+class TestExecutor(TestCase):
+
+    def setUp(self):
+        self.executor = Executor(workers=2)
+
+    def tearDown(self):
+        self.executor.close()
+
+    def test_SUBMIT(self):
+        future = self.executor.submit(dict, arg1='arg1')
+        self.assertEqual(future.get(), dict(arg1='arg1'))
+
+    def test_SUBMIT_raises(self):
+        future = self.executor.submit(int, 'fake')
+        self.assertRaises(ValueError, future.get)
+
+    def test_MAP_keeps_order(self):
+        futures = self.executor.map(str, range(10))
+        self.assertEqual([future.get() for future in futures],
+                         map(str, range(10)))
+
+    def test_CONCURRENT_calls(self):
+        barrier = threading.Event()
+        blocked = self.executor.submit(barrier.wait, 5)
+        self.executor.submit(barrier.set).get(5)
+        self.assertTrue(blocked.get(5))
@@ -26,3 +26,16 @@ class TestJson(TestCase):
     def test_decoder(self):
         to_dict = json.loads(self.json_)
         self.assertEquals(self.dict_, to_dict)
+
+    def test_parse_date(self):
+        self.assertEqual(json.parse_date('2008-01-14T04:33:35Z'),
+                         datetime(2008, 1, 14, 4, 33, 35))
+        self.assertEqual(json.parse_date(u'2008-01-14T04:33:35Z'),
+                         datetime(2008, 1, 14, 4, 33, 35))
+
+    def test_parse_date_with_NOT_dates(self):
+        self.assertIsNone(json.parse_date('2008-13-14T04:33:35Z'))
+        self.assertIsNone(json.parse_date('2008-01-14 04:33:35Z'))
+        self.assertIsNone(json.parse_date('https://api.github.com/users/a'))
+        self.assertIsNone(json.parse_date(20080114))
+        self.assertIsNone(json.parse_date(None))
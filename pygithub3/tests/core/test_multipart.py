@@ -0,0 +1,62 @@
+# -*- encoding: utf-8 -*-
+
+import mmap
+import tempfile
+from StringIO import StringIO
+
+from pygithub3.core.multipart import MultipartStream, file_size
+from pygithub3.tests.utils.core import TestCase
+
+
+class TestMultipartStream(TestCase):
+
+    def setUp(self):
+        self.progress = []
+        self.body = MultipartStream(
+            [('key', 'path'), ('Filename', u'ñ.txt')], 'file',
+            StringIO('0123456789'), 10, 'n.txt', chunk_size=4,
+            progress=lambda sent, total: self.progress.append(sent))
+
+    def test_BODY(self):
+        boundary = self.body.boundary
+        self.assertEqual(self.body.read(), (
+            '--%(b)s\r\nContent-Disposition: form-data; name="key"\r\n\r\n'
+            'path\r\n--%(b)s\r\nContent-Disposition: form-data; '
+            'name="Filename"\r\n\r\n\xc3\xb1.txt\r\n--%(b)s\r\n'
+            'Content-Disposition: form-data; name="file"; filename="n.txt"'
+            '\r\nContent-Type: application/octet-stream\r\n\r\n0123456789'
+            '\r\n--%(b)s--\r\n') % dict(b=boundary))
+        self.assertEqual(self.body.content_type,
+                         'multipart/form-data; boundary=%s' % boundary)
+
+    def test_READ_in_blocks(self):
+        blocks = list(iter(lambda: self.body.read(8), ''))
+        self.assertTrue(all([len(block) == 8 for block in blocks[:-1]]))
+        self.assertEqual(len(''.join(blocks)), len(self.body))
+        self.assertEqual(self.progress[-1], len(self.body))
+
+    def test_ITERATOR_of_chunks(self):
+        body = MultipartStream({}, 'file', iter(['01', '', '234']), 5)
+        self.assertIn('\r\n\r\n01234\r\n', body.read())
+
+    def test_RAISE_wrong_size(self):
+        body = MultipartStream({}, 'file', StringIO('012'), 5)
+        self.assertRaises(ValueError, body.read)
+
+
+class TestFileSize(TestCase):
+
+    def test_FILE(self):
+        fileobj = tempfile.TemporaryFile()
+        fileobj.write('0123456789')
+        fileobj.seek(4)
+        self.assertEqual(file_size(fileobj), 6)
+        fileobj.seek(0)
+        mapped = mmap.mmap(fileobj.fileno(), 0)
+        self.assertEqual(file_size(mapped), 10)
+        mapped.close()
+        fileobj.close()
+
+    def test_UNKNOWN(self):
+        self.assertIsNone(file_size(StringIO('0123')))
+        self.assertIsNone(file_size(iter(['0123'])))
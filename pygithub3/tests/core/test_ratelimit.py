@@ -0,0 +1,159 @@
+# -*- encoding: utf-8 -*-
+
+import requests
+from mock import patch
+
+from pygithub3.core.client import Client
+from pygithub3.core.ratelimit import RateLimit, RateLimiter
+from pygithub3.exceptions import RateLimitExceeded
+from pygithub3.github import Github
+from pygithub3.tests.utils.base import mock_response
+from pygithub3.tests.utils.core import TestCase
+
+
+def ratelimit_headers(remaining, reset=1000, limit=5000):
+    return {'x-ratelimit-limit': str(limit),
+            'x-ratelimit-remaining': str(remaining),
+            'x-ratelimit-reset': str(reset)}
+
+
+class TestRateLimit(TestCase):
+
+    def setUp(self):
+        self.limit = RateLimit(burst=2)
+
+    def test_UPDATE(self):
+        self.limit.update(ratelimit_headers(4999))
+        self.assertEqual(self.limit.budget(),
+                         dict(limit=5000, remaining=4999, reset=1000,
+                              requests=0, exceeded=0))
+
+    def test_UPDATE_without_headers(self):
+        self.limit.update({})
+        self.assertIsNone(self.limit.remaining)
+
+    def test_EXHAUSTED(self):
+        self.limit.update(ratelimit_headers(0, reset=1000))
+        self.assertEqual(self.limit.exhausted(now=900), 100)
+        self.assertEqual(self.limit.exhausted(now=1100), 0)
+
+    def test_RESERVE_without_pace(self):
+        self.limit.update(ratelimit_headers(10))
+        self.assertEqual(self.limit.reserve(pace=False, now=900), 0)
+        self.assertEqual(self.limit.remaining, 9)
+
+    def test_RESERVE_paced(self):
+        self.limit.update(ratelimit_headers(9, reset=1000))
+        self.limit.stamp = 900
+        # Burst of 2, then 7 remaining requests in 100 seconds
+        self.assertEqual(self.limit.reserve(now=900), 0)
+        self.assertEqual(self.limit.reserve(now=900), 0)
+        self.assertAlmostEqual(self.limit.reserve(now=900), 100 / 7.0)
+        self.assertEqual(self.limit.remaining, 6)
+
+
+class TestRateLimiter(TestCase):
+
+    def setUp(self):
+        self.limiter = RateLimiter()
+        self.limiter.update('token', ratelimit_headers(0, reset=2 ** 40))
+
+    def test_PER_credential(self):
+        self.limiter.update('other', ratelimit_headers(10))
+        self.assertEqual(self.limiter.budget()['token']['remaining'], 0)
+        self.assertEqual(self.limiter.budget()['other']['remaining'], 10)
+
+    def test_RAISE_exhausted(self):
+        self.assertRaises(RateLimitExceeded, self.limiter.acquire, 'token')
+        self.limiter.acquire('other')
+
+    def test_CHOOSE_most_remaining(self):
+        self.limiter.update('other', ratelimit_headers(10))
+        self.limiter.update('another', ratelimit_headers(20))
+        self.assertEqual(self.limiter.choose(('token', 'other', 'another')),
+                         'another')
+        self.assertEqual(self.limiter.choose(('other', 'unused')), 'unused')
+
+    def test_CHOOSE_first_reset_if_exhausted(self):
+        self.limiter.update('other', ratelimit_headers(0, reset=2 ** 41))
+        self.assertEqual(self.limiter.choose(('other', 'token')), 'token')
+
+    def test_COUNT_requests(self):
+        self.limiter.acquire('other')
+        self.assertRaises(RateLimitExceeded, self.limiter.acquire, 'token')
+        self.assertEqual(self.limiter.budget()['other']['requests'], 1)
+        self.assertEqual(self.limiter.budget()['token']['requests'], 0)
+
+    @patch('pygithub3.core.ratelimit.time')
+    def test_WAIT_exhausted(self, time):
+        self.limiter.wait = True
+        time.time.return_value = 2 ** 40 - 60
+        self.limiter.acquire('token')
+        time.sleep.assert_called_with(60)
+
+
+@patch.object(requests.sessions.Session, 'request')
+class TestClientRateLimit(TestCase):
+
+    def test_TRACK_credential(self, request_method):
+        response = mock_response()
+        response.headers = ratelimit_headers(4000)
+        request_method.return_value = response
+        c = Client(token='token')
+        self.assertEqual(c.remaining_requests, '~')
+        c.get('')
+        self.assertEqual(c.remaining_requests, 4000)
+        self.assertEqual(Client(login='login', password='password',
+                                ratelimit=c.ratelimit).remaining_requests,
+                         '~')
+
+    def test_RAISE_403_exhausted(self, request_method):
+        response = mock_response(403)
+        response.headers = ratelimit_headers(0)
+        request_method.return_value = response
+        self.assertRaises(RateLimitExceeded, Client().get, '')
+
+    def test_GITHUB_shares_limits(self, request_method):
+        response = mock_response()
+        response.headers = ratelimit_headers(4000)
+        request_method.return_value = response
+        gh = Github(token='token')
+        gh.repos.commits._client.get('')
+        self.assertEqual(gh.remaining_requests, 4000)
+        self.assertEqual(gh.rate_limits['token']['remaining'], 4000)
+
+
+@patch.object(requests.sessions.Session, 'request')
+class TestClientTokens(TestCase):
+
+    def setUp(self):
+        self.c = Client(tokens=['token1', 'token2'])
+
+    def test_ROTATE_by_remaining(self, request_method):
+        response = mock_response()
+        response.headers = ratelimit_headers(4000)
+        request_method.return_value = response
+        self.c.get('')
+        self.c.ratelimit.update('token1', ratelimit_headers(10))
+        self.c.get('')
+        tokens = [call[1]['params']['access_token']
+                  for call in request_method.call_args_list]
+        self.assertEqual(tokens, ['token1', 'token2'])
+        self.assertEqual(self.c.remaining_requests, 4010)
+
+    def test_ROTATE_on_exhausted(self, request_method):
+        exhausted = mock_response(403)
+        exhausted.headers = ratelimit_headers(0, reset=2 ** 40)
+        response = mock_response()
+        response.headers = ratelimit_headers(4000)
+        request_method.side_effect = [exhausted, response]
+        self.assertEqual(self.c.get(''), response)
+        budget = self.c.ratelimit.budget()
+        self.assertEqual(budget['token1']['exceeded'], 1)
+        self.assertEqual(budget['token2']['requests'], 1)
+
+    def test_RAISE_all_exhausted(self, request_method):
+        for token in self.c.tokens:
+            self.c.ratelimit.update(token, ratelimit_headers(0, 2 ** 40))
+        self.assertRaises(RateLimitExceeded, self.c.get, '')
+        self.assertFalse(request_method.called)
@@ -1,7 +1,11 @@
 # -*- encoding: utf-8 -*-
 
+import gzip
+from StringIO import StringIO
+
 from mock import Mock
 
+from pygithub3.core import json
 from pygithub3.core.client import Client
 from pygithub3.core.result import smart, normal, base
 from pygithub3.tests.utils.core import (TestCase, mock_paginate_github_in_GET,
@@ -56,6 +60,12 @@ class TestSmartResultWithPaginate(ResultInitMixin, TestCase):
         self.assertEqual(self.get_request.call_count, 0)
         self.assertEqual(self.resource_loads.call_count, 0)
 
+    def test_INTERN_shares_identities(self):
+        self.r.intern().all()
+        identities = self.resource_loads.call_args[1]['identities']
+        self.assertEqual(identities, {})
+        self.assertIs(identities, self.r.getter.identities)
+
 
 class TestSmartResultWithoutPaginate(ResultInitMixin, TestCase):
 
@@ -96,3 +106,368 @@ class TestNormalResult(TestSmartResultWithPaginate, TestCase):
         def test_CACHE_with_renew_iterations(self):
         def test_ITERATOR_calls(self):
     """
+
+
+class TestSmartResultPrefetch(ResultInitMixin, TestCase):
+
+    @property
+    def mock(self):
+        return mock_paginate_github_in_GET
+
+    def setUp(self):
+        super(TestSmartResultPrefetch, self).setUp()
+        self.r.prefetch(workers=2)
+
+    def test_LAZY_until_consumed(self):
+        self.assertEqual(self.get_request.call_count, 0)
+
+    def test_all_iteration_CALLS(self):
+        resources = self.r.all()
+        self.assertEqual(self.get_request.call_count, 3)
+        self.assertEqual(len(resources), 5)
+        self.assertEqual(self.r.getter.pending, {})
+
+    def test_PREFETCH_after_first_page(self):
+        self.r.get_page(1)  # Gets last page
+        for pending in self.r.getter.pending.values():
+            pending.wait()
+        self.assertEqual(self.get_request.call_count, 3)
+        self.assertEqual(sorted(self.r.getter.cache), ['1', '2', '3'])
+
+    def test_KEEP_order(self):
+        pages = [page.page for page in self.r]
+        self.assertEqual(pages, [1, 2, 3])
+
+    def test_PREFETCH_after_resumed_page(self):
+        self.assertEqual(len(self.r.resume(dict(page=3, last_page=3)).all()),
+                         1)
+        for pending in self.r.getter.pending.values():
+            pending.wait()
+        self.get_request.assert_called_once_with(request, page=3)
+
+    def test_PREFETCH_window(self):
+        self.r.prefetch(workers=1)
+        self.r.get_page(1)
+        for pending in self.r.getter.pending.values():
+            pending.wait()
+        self.assertEqual(sorted(self.r.getter.cache), ['1', '2'])
+
+    def test_NOT_prefetch_with_until(self):
+        self.assertEqual(self.r.all(until=lambda resource: True), [])
+        self.assertEqual(self.get_request.call_count, 1)
+        self.assertEqual(self.r.getter.pending, {})
+
+    def test_RAISE_prefetch_errors(self):
+        self.get_request.side_effect = [mock_paginate_github_in_GET(None, 1),
+                                        ValueError, ValueError]
+        self.assertRaises(ValueError, self.r.all)
+
+
+class TestNormalResultReadAhead(ResultInitMixin, TestCase):
+
+    @property
+    def mock(self):
+        return MockPaginate()
+
+    def setUp(self):
+        super(TestNormalResultReadAhead, self).setUp()
+        self.r = normal.Result(normal.Method(self.c.get, request))
+        self.r.read_ahead(pages=2)
+
+    def tearDown(self):
+        super(TestNormalResultReadAhead, self).tearDown()
+        self.wait_reader()
+
+    def wait_reader(self):
+        if self.r.getter.reader:
+            self.r.getter.reader.join()
+
+    def test_LAZY_until_consumed(self):
+        self.assertEqual(self.get_request.call_count, 0)
+
+    def test_READ_ahead_of_consumed(self):
+        self.r.next()
+        self.wait_reader()
+        self.assertEqual(self.get_request.call_count, 3)
+        self.assertEqual(sorted(self.r.getter.cache), ['1', '2', '3'])
+
+    def test_BOUNDED_reading(self):
+        self.r.read_ahead(pages=1)
+        self.r.next()
+        self.wait_reader()
+        self.assertEqual(self.get_request.call_count, 2)
+
+    def test_all_iteration_CALLS(self):
+        resources = self.r.all()
+        self.assertEqual(len(resources), 5)
+        self.assertEqual(self.get_request.call_count, 3)
+        self.assertEqual([page.page for page in self.r], [1, 2, 3])
+
+    def test_RAISE_reading_errors(self):
+        self.get_request.side_effect = [MockPaginate()(), ValueError]
+        self.assertRaises(ValueError, self.r.all)
+
+    def test_STREAM_with_reading(self):
+        self.r.stream()
+        self.assertEqual(len(self.r.all()), 5)
+        self.assertEqual(self.get_request.call_count, 3)
+        self.assertEqual(list(self.r.getter.cache), ['3'])
+
+
+class TestSmartResultCursor(ResultInitMixin, TestCase):
+
+    @property
+    def mock(self):
+        return mock_paginate_github_in_GET
+
+    def test_CURSOR_position(self):
+        self.assertEqual(self.r.cursor, dict(page=1, last_page=None))
+        self.r.next()
+        self.assertEqual(self.r.cursor, dict(page=2, last_page=3))
+
+    def test_CURSOR_after_errors(self):
+        self.get_request.side_effect = [mock_paginate_github_in_GET(None, 1),
+                                        ValueError]
+        self.assertRaises(ValueError, self.r.all)
+        self.assertEqual(self.r.cursor, dict(page=2, last_page=3))
+
+    def test_RESUME(self):
+        result = smart.Result(smart.Method(self.c.get, request))
+        self.assertEqual(len(result.resume(dict(page=3, last_page=3)).all()),
+                         1)
+        self.get_request.assert_called_once_with(request, page=3)
+
+
+class TestNormalResultCursor(ResultInitMixin, TestCase):
+
+    @property
+    def mock(self):
+        return MockPaginate()
+
+    def setUp(self):
+        super(TestNormalResultCursor, self).setUp()
+        self.r = normal.Result(normal.Method(self.c.get, request))
+
+    def test_CURSOR_position(self):
+        self.assertEqual(self.r.cursor, dict(page=1, params={}))
+        self.r.next()
+        self.assertEqual(self.r.cursor, dict(page=2, params={'page': '1'}))
+        self.r.next()
+        self.r.next()
+        self.assertEqual(self.r.cursor, dict(page=4, params=None))
+
+    def test_RESUME(self):
+        paginate = MockPaginate()
+        paginate.counter = 3
+        self.get_request.side_effect = paginate
+        self.r.resume(dict(page=3, params={'page': '2'}))
+        self.assertEqual(len(list(self.r)), 1)
+        self.get_request.assert_called_once_with(request, page='2')
+        self.assertEqual(self.r.cursor, dict(page=3, params={'page': '2'}))
+        self.assertEqual(len(list(self.r)), 1)  # Cached from the start
+        self.assertEqual(self.get_request.call_count, 1)
+
+    def test_CURSOR_without_private_params(self):
+        self.r.getter.session_params = {'per_page': 100}
+        self.r.resume(dict(page=3, params={'page': '2', 'per_page': '100',
+                                           'access_token': 'token'}))
+        self.assertEqual(self.r.cursor, dict(page=3, params={'page': '2'}))
+
+    def test_CURSOR_after_errors(self):
+        self.get_request.side_effect = [MockPaginate()(), ValueError]
+        self.assertRaises(ValueError, self.r.all)
+        self.assertEqual(self.r.cursor, dict(page=2, params={'page': '1'}))
+
+    def test_NOT_resume_without_params(self):
+        self.assertRaises(ValueError, self.r.resume, dict(page=5, params={}))
+        self.r.stream().next()
+        self.r.next()
+        self.r.getter.cache.clear()
+        self.assertRaises(ValueError, getattr, self.r, 'cursor')
+
+    def test_RESUME_finished(self):
+        self.assertEqual(self.r.resume(dict(page=4, params=None)).all(), [])
+        self.assertFalse(self.get_request.called)
+
+
+class TestSmartResultStream(ResultInitMixin, TestCase):
+
+    @property
+    def mock(self):
+        return mock_paginate_github_in_GET
+
+    def test_KEEP_last_pages(self):
+        self.r.stream(pages=2)
+        self.assertEqual(len(self.r.all()), 5)
+        self.assertEqual(sorted(self.r.getter.cache), ['2', '3'])
+        self.assertEqual(self.get_request.call_count, 3)
+
+    def test_REQUEST_again_discarded(self):
+        self.r.stream().all()
+        self.assertEqual(len(self.r.all()), 5)
+        self.assertEqual(self.get_request.call_count, 5)  # 3 kept
+
+
+class TestNormalResultStream(ResultInitMixin, TestCase):
+
+    @property
+    def mock(self):
+        return MockPaginate()
+
+    def setUp(self):
+        super(TestNormalResultStream, self).setUp()
+        self.r = normal.Result(normal.Method(self.c.get, request)).stream()
+
+    def test_KEEP_last_page(self):
+        self.assertEqual(len(self.r.all()), 5)
+        self.assertEqual(self.get_request.call_count, 3)
+        self.assertEqual(list(self.r.getter.cache), ['3'])
+
+    def test_REQUEST_again_discarded(self):
+        self.r.all()
+        self.get_request.side_effect = MockPaginate()
+        self.assertEqual(len(self.r.all()), 5)
+        self.assertEqual(self.get_request.call_count, 6)
+        self.assertEqual(self.get_request.call_args_list[3][1], {})
+
+    def test_REQUEST_again_resumed(self):
+        paginate = MockPaginate()
+        paginate.counter = 2
+        self.get_request.side_effect = paginate
+        self.r.resume(dict(page=2, params={'page': '1'}))
+        self.assertEqual(len(self.r.all()), 3)
+        paginate.counter = 2
+        self.assertEqual(len(self.r.all()), 3)
+        self.assertEqual(self.get_request.call_args_list[2][1],
+                         {'page': '1'})
+
+
+class TestSmartResultLimit(ResultInitMixin, TestCase):
+
+    @property
+    def mock(self):
+        return lambda request, page, **kwargs: mock_paginate_github_in_GET(
+            request, page)
+
+    def test_LIMIT_stops_requests(self):
+        self.assertEqual(len(self.r.all(limit=3)), 3)
+        self.assertEqual(self.get_request.call_count, 2)
+
+    def test_LIMIT_shrinks_per_page(self):
+        self.r.all(limit=1)
+        self.get_request.assert_called_once_with(request, page=1, per_page=1)
+
+    def test_NOT_shrink_after_requests(self):
+        self.r.next()
+        self.r.all(limit=1)
+        self.assertNotIn('per_page', self.get_request.call_args[1])
+        self.assertEqual(self.r.all(limit=0), [])
+
+    def test_UNTIL_stops_requests(self):
+        stops = iter([False, True])
+        self.assertEqual(len(self.r.all(until=lambda resource:
+                                        next(stops))), 1)
+        self.assertEqual(self.get_request.call_count, 1)
+
+    def test_ALL_after_limit(self):
+        self.assertEqual(len(self.r.all(limit=3)), 3)
+        self.get_request.reset_mock()
+        self.assertEqual(len(self.r.all()), 5)
+        self.assertEqual(self.get_request.call_count, 3)
+        self.assertNotIn('per_page', self.get_request.call_args[1])
+
+    def test_NOT_shrink_resumed(self):
+        self.r.resume(dict(page=2, last_page=3))
+        self.r.all(limit=1)
+        self.get_request.assert_called_once_with(request, page=2)
+
+
+class TestNormalResultLimit(ResultInitMixin, TestCase):
+
+    @property
+    def mock(self):
+        return MockPaginate()
+
+    def setUp(self):
+        super(TestNormalResultLimit, self).setUp()
+        self.r = normal.Result(normal.Method(self.c.get, request))
+
+    def test_LIMIT_stops_requests(self):
+        self.assertEqual(len(self.r.all(limit=200)), 5)
+        self.r = normal.Result(normal.Method(self.c.get, request))
+        self.assertEqual(len(self.r.iterator(limit=150).next()), 1)
+        self.assertEqual(self.get_request.call_count, 4)
+        self.assertNotIn('per_page', self.get_request.call_args[1])
+
+    def test_LIMIT_shrinks_per_page(self):
+        self.assertEqual(len(self.r.all(limit=2)), 2)
+        self.get_request.assert_called_once_with(request, per_page=2)
+
+    def test_ALL_after_limit(self):
+        self.assertEqual(len(self.r.all(limit=1)), 1)
+        self.get_request.reset_mock()
+        self.get_request.side_effect = MockPaginate()
+        self.assertEqual(len(self.r.all()), 5)
+        self.assertEqual(self.get_request.call_count, 3)
+        self.assertEqual(self.get_request.call_args_list[0][1], {})
+        self.assertEqual(len(self.r.all()), 5)
+        self.assertEqual(self.get_request.call_count, 3)
+
+    def test_KEEP_position_on_errors(self):
+        self.get_request.side_effect = [MockPaginate()(), ValueError]
+        self.assertRaises(ValueError, self.r.all)
+        self.assertEqual(self.r.cursor, dict(page=2, params={'page': '1'}))
+
+    def test_NOT_shrink_resumed(self):
+        self.r.resume(dict(page=3, params={'page': '2'}))
+        self.r.all(limit=1)
+        self.get_request.assert_called_once_with(request, page='2')
+
+
+class TestResultExport(TestCase):
+
+    def setUp(self):
+        def get(request, page=1, **kwargs):
+            response = Mock()
+            response.headers = {
+                'link': '<https://d.com/d?page=2>; rel="last"'}
+            response.content = json.dumps(
+                [{'id': page, 'created_at': '2008-01-14T04:33:35Z'}] * page)
+            return response
+        self.get_request = Mock(side_effect=get)
+        self.r = smart.Result(smart.Method(self.get_request, request))
+
+    def test_EXPORT_jsonl(self):
+        output = StringIO()
+        stats = self.r.export(output)
+        resources = [json.loads(line, object_hook=None)
+                     for line in output.getvalue().splitlines()]
+        self.assertEqual([resource['id'] for resource in resources],
+                         [1, 2, 2])
+        self.assertEqual(resources[0]['created_at'], '2008-01-14T04:33:35Z')
+        self.assertEqual(stats['resources'], 3)
+        self.assertEqual(stats['pages'], 2)
+        self.assertEqual(stats['bytes'], len(output.getvalue()))
+        self.assertEqual(self.r.getter.cache, {})
+        self.assertIs(self.r.getter.resource, request.resource)
+        self.assertIsNone(self.r.getter.max_cached_pages)
+
+    def test_EXPORT_iterated(self):
+        self.r.getter.resource = Mock()
+        self.r.getter.resource.loads.side_effect = lambda content, **kwargs: [
+            object() for resource in json.loads(content)]
+        resources = self.r.all()
+        output = StringIO()
+        self.assertEqual(self.r.export(output)['resources'], 3)
+        self.assertEqual(self.r.all(), resources)
+
+    def test_EXPORT_gzipped(self):
+        output = StringIO()
+        self.r.export(output, compress=True)
+        output.seek(0)
+        lines = gzip.GzipFile(fileobj=output).read().splitlines()
+        self.assertEqual(len(lines), 3)
+
+    def test_UNSUPPORTED_format(self):
+        self.assertRaises(ValueError, self.r.export, StringIO(), 'csv')
+        self.assertFalse(self.get_request.called)
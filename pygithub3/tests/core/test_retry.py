@@ -0,0 +1,90 @@
+# -*- encoding: utf-8 -*-
+
+import requests
+from mock import patch
+
+from pygithub3.core.client import Client
+from pygithub3.core.retry import Retry
+from pygithub3.tests.utils.base import mock_response
+from pygithub3.tests.utils.core import TestCase
+
+
+def failure(status_code, **headers):
+    response = mock_response(status_code)
+    response.headers = headers
+    response.raise_for_status.side_effect = requests.exceptions.HTTPError
+    return response
+
+
+class TestRetry(TestCase):
+
+    def setUp(self):
+        self.retry = Retry(attempts=3, backoff=1, max_backoff=3)
+
+    def test_ALLOWS_idempotent_verbs(self):
+        self.assertTrue(self.retry.allows('GET', 0))
+        self.assertTrue(self.retry.allows('delete', 1))
+        self.assertFalse(self.retry.allows('get', 2))
+        self.assertFalse(self.retry.allows('post', 0))
+        self.assertFalse(self.retry.allows('patch', 0))
+
+    def test_IS_transient(self):
+        self.assertTrue(self.retry.is_transient(failure(502)))
+        self.assertTrue(self.retry.is_transient(
+            failure(403, **{'retry-after': '30'})))
+        self.assertFalse(self.retry.is_transient(failure(403)))
+        self.assertFalse(self.retry.is_transient(
+            failure(403, **{'retry-after': '30',
+                            'x-ratelimit-remaining': '0'})))
+        self.assertFalse(self.retry.is_transient(failure(404)))
+
+    def test_DELAY_with_jitter(self):
+        for retry, limit in ((0, 1), (1, 2), (2, 3), (5, 3)):
+            delay = self.retry.delay(retry)
+            self.assertTrue(0 <= delay <= limit)
+
+    def test_DELAY_retry_after(self):
+        self.assertEqual(self.retry.delay(
+            0, failure(503, **{'retry-after': '7'})), 7)
+        self.assertTrue(self.retry.delay(
+            0, failure(503, **{'retry-after': 'soon'})) <= 1)
+
+
+@patch('pygithub3.core.client.time')
+@patch.object(requests.sessions.Session, 'request')
+class TestClientRetry(TestCase):
+
+    def setUp(self):
+        self.c = Client()
+
+    def test_RETRY_transient_status(self, request_method, time):
+        response = mock_response()
+        response.headers = {}
+        request_method.side_effect = [
+            failure(502), failure(503, **{'retry-after': '2'}), response]
+        self.assertEqual(self.c.get(''), response)
+        self.assertEqual(request_method.call_count, 3)
+        time.sleep.assert_called_with(2)
+
+    def test_RAISE_after_attempts(self, request_method, time):
+        request_method.return_value = failure(503)
+        self.assertRaises(requests.exceptions.HTTPError, self.c.get, '')
+        self.assertEqual(request_method.call_count, 3)
+
+    def test_RETRY_connection_errors(self, request_method, time):
+        request_method.side_effect = requests.exceptions.ConnectionError
+        self.assertRaises(requests.exceptions.ConnectionError,
+                          self.c.delete, '')
+        self.assertEqual(request_method.call_count, 3)
+
+    def test_NOT_RETRY_not_idempotent(self, request_method, time):
+        request_method.return_value = failure(502)
+        self.assertRaises(requests.exceptions.HTTPError, self.c.post, '')
+        self.assertEqual(request_method.call_count, 1)
+        self.assertFalse(time.sleep.called)
+
+    def test_CONFIG_retry(self, request_method, time):
+        request_method.return_value = failure(502)
+        c = Client(retry=Retry(attempts=1))
+        self.assertRaises(requests.exceptions.HTTPError, c.get, '')
+        self.assertEqual(request_method.call_count, 1)
@@ -0,0 +1,51 @@
+# -*- encoding: utf-8 -*-
+
+from mock import Mock
+
+from pygithub3.core.client import Client
+from pygithub3.core.transport import Transport
+from pygithub3.github import Github
+from pygithub3.tests.utils.core import TestCase
+
+
+class TestTransport(TestCase):
+
+    def test_INIT_with_pool_config(self):
+        transport = Transport.from_config(dict(pool_maxsize=20, user='me'))
+        self.assertEqual(
+            transport.poolmanager.connection_pool_kw['maxsize'], 20)
+
+    def test_clients_SHARE_pool(self):
+        transport = Transport()
+        c1, c2 = Client(transport=transport), Client(transport=transport)
+        self.assertIs(c1.requester.poolmanager, c2.requester.poolmanager)
+        self.assertIsNot(c1.requester, c2.requester)
+
+    def test_clients_without_transport_DONT_share(self):
+        c1, c2 = Client(), Client()
+        self.assertIsNot(c1.requester.poolmanager, c2.requester.poolmanager)
+
+    def test_stats(self):
+        transport = Transport()
+        pool = transport.poolmanager.connection_from_url(
+            'https://api.github.com/users')
+        pool.num_connections, pool.num_requests = 2, 10
+        self.assertEqual(transport.stats(), {
+            'https://api.github.com:443': dict(connections=2, requests=10,
+                                               reused=8)})
+
+
+class TestGithubTransport(TestCase):
+
+    def test_services_SHARE_pool(self):
+        gh = Github(pool_maxsize=5)
+        poolmanager = gh._transport.poolmanager
+        clients = (gh.users._client, gh.repos._client,
+                   gh.repos.commits._client, gh.issues.comments._client,
+                   gh.git_data.blobs._client, gh.events.repos._client)
+        for client in clients:
+            self.assertIs(client.requester.poolmanager, poolmanager)
+
+    def test_pool_stats(self):
+        gh = Github(transport=Mock(stats=Mock(return_value={})))
+        self.assertEqual(gh.pool_stats, {})
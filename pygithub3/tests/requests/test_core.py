@@ -2,7 +2,7 @@
 
 from pygithub3.exceptions import (UriInvalid, RequestDoesNotExist,
     ValidationError, InvalidBodySchema)
-from pygithub3.requests.base import Factory, Body, Request
+from pygithub3.requests.base import Factory, Body, Request, compile_uri
 from pygithub3.tests.utils.base import DummyRequest, dummy_json
 from pygithub3.tests.utils.core import TestCase
 from pygithub3.tests.utils.requests import (RequestWithArgs, RequestCleanedUri,
@@ -29,6 +29,18 @@ class TestFactory(TestCase):
         request = self.f('users.get')
         self.assertIsInstance(request, Request)
 
+    def test_BUILDER_caches_classes(self):
+        request = self.f('users.get')
+        self.assertIs(Factory.request_classes['users.get'],
+                      request.__class__)
+
+    def test_PRELOAD(self):
+        from pygithub3.requests.pull_requests import Is_merged
+        Factory.preload()
+        self.assertIs(Factory.request_classes['pull_requests.is_merged'],
+                      Is_merged)
+        self.assertNotIn('repos.downloads.request', Factory.request_classes)
+
 
 class TestRequest(TestCase):
 
@@ -36,6 +48,17 @@ class TestRequest(TestCase):
         request = RequestWithArgs(arg1='arg1', arg2='arg2')
         self.assertEqual(str(request), 'URI/arg1/arg2')
 
+    def test_SIMPLE_with_slashes(self):
+        request = RequestWithArgs(arg1='', arg2='arg2')
+        request.uri = '/URI/{arg2}/%/{arg1}'
+        self.assertEqual(str(request), 'URI/arg2/%')
+
+    def test_COMPILED_uri(self):
+        self.assertEqual(compile_uri('/URI/{arg1}/{arg2}/'),
+                         'URI/%(arg1)s/%(arg2)s')
+        self.assertIsNone(compile_uri('URI/{arg1!r}'))
+        self.assertIsNone(compile_uri('URI/{arg1.attr}'))
+
     def test_SIMPLE_without_needed_args(self):
         request = RequestWithArgs()
         self.assertRaises(ValidationError, str, request)
@@ -1,11 +1,13 @@
 # -*- encoding: utf-8 -*-
 
+import pickle
 from datetime import datetime
 
 from pygithub3.core import json
-from pygithub3.resources.base import Raw
+from pygithub3.resources.base import Raw, Resource
 from pygithub3.tests.utils.core import TestCase
-from pygithub3.tests.utils.resources import Nested, Simple, HasSimple
+from pygithub3.tests.utils.resources import (Nested, Simple, HasSimple,
+    Compacted, HasInterned)
 
 simple_resource = dict(type='simple')
 has_simple = dict(type='has_simple', simple=simple_resource)
@@ -13,6 +15,7 @@ github_dict = dict(
     id=1,
     name='name_test',
     date='2008-01-14T04:33:35Z',
+    undeclared_date='2008-01-14T04:33:35Z',
     simple=simple_resource,
     list_collection=[has_simple] * 2,
     items_collections=dict(arg1=has_simple, arg2=has_simple)
@@ -61,6 +64,132 @@ class TestResourceMapping(TestCase):
         self.assertIsInstance(self.r.self_nested_dict['arg1'], Nested)
 
 
+class TestResourceDates(TestCase):
+
+    def tearDown(self):
+        Resource.schema_dates = True
+
+    def test_ONLY_declared_dates(self):
+        r = Nested.loads(github_return)
+        self.assertEqual(r.self_nested.date, datetime(2008, 1, 14, 4, 33, 35))
+        self.assertEqual(r.self_nested_list[0].date,
+                         datetime(2008, 1, 14, 4, 33, 35))
+        self.assertEqual(r.undeclared_date, '2008-01-14T04:33:35Z')
+
+    def test_NOT_dates_in_declared(self):
+        r = Nested.loads(json.dumps(dict(date=None)))
+        self.assertIsNone(r.date)
+
+    def test_WITHOUT_schema_dates(self):
+        Resource.schema_dates = False
+        r = Nested.loads(github_return)
+        self.assertEqual(r.date, datetime(2008, 1, 14, 4, 33, 35))
+        self.assertEqual(r.undeclared_date, datetime(2008, 1, 14, 4, 33, 35))
+
+
+class TestLazyResource(TestResourceMapping):
+
+    def setUp(self):
+        Resource.lazy = True
+        super(TestLazyResource, self).setUp()
+
+    def tearDown(self):
+        Resource.lazy = False
+
+    def test_BUILD_on_access(self):
+        self.assertNotIn('simple', self.r.__dict__)
+        simple = self.r.simple
+        self.assertIn('simple', self.r.__dict__)
+        self.assertIs(self.r.simple, simple)
+        self.assertEqual(self.r._attrs['simple'], simple_resource)
+
+    def test_RAISE_unknown_attributes(self):
+        self.assertRaises(AttributeError, getattr, self.r, 'fake')
+        self.assertFalse(hasattr(self.r, 'fake'))
+
+    """ Inherit tests. They share behaviour
+        def test_attrs_map(self):
+        def test_MAPS(self):
+        def test_LIST_collection_map(self):
+        ...
+    """
+
+
+class TestCompactResource(TestCase):
+
+    def setUp(self):
+        self.r = Compacted.loads(github_return)
+
+    def test_attrs_map(self):
+        self.assertEqual(self.r.id, 1)
+        self.assertEqual(self.r.date, datetime(2008, 1, 14, 4, 33, 35))
+        self.assertIsInstance(self.r.simple, Simple)
+
+    def test_ONLY_fields(self):
+        self.assertFalse(hasattr(self.r, '__dict__'))
+        self.assertFalse(hasattr(self.r, '_attrs'))
+        self.assertFalse(hasattr(self.r, 'name'))
+        self.assertFalse(hasattr(self.r, 'missing'))
+
+    def test_KEEP_methods(self):
+        self.assertEqual(str(self.r), '<Compacted (1)>')
+        self.assertEqual(self.r.__class__.__name__, 'CompactCompacted')
+        self.assertIs(self.r.__class__, Compacted.loads(github_return).__class__)
+
+    def test_INSTANCE_of_resource(self):
+        self.assertIsInstance(self.r, Compacted)
+        self.assertIsInstance(self.r, Resource)
+        self.assertNotIsInstance(self.r, Simple)
+        self.assertIsInstance(self.r.simple, Simple)
+
+    def test_PICKLE(self):
+        for protocol in (0, 2):
+            r = pickle.loads(pickle.dumps(self.r, protocol))
+            self.assertIs(r.__class__, self.r.__class__)
+            self.assertEqual((r.id, r.date), (self.r.id, self.r.date))
+            self.assertFalse(hasattr(r, 'missing'))
+
+
+class TestInternedResource(TestCase):
+
+    def setUp(self):
+        interned = dict(id=1, login='octocat')
+        self.json = json.dumps([
+            dict(interned=interned, interneds=[interned, dict(id=2)]),
+            dict(interned=interned, interneds=[dict(url='url'), dict(name=3)])
+        ])
+
+    def test_SHARED_in_decode(self):
+        r1, r2 = HasInterned.loads(self.json)
+        self.assertIs(r1.interned, r2.interned)
+        self.assertIs(r1.interned, r1.interneds[0])
+        self.assertIsNot(r1.interneds[1], r1.interned)
+
+    def test_WITHOUT_id_or_url(self):
+        r1, r2 = HasInterned.loads(self.json)
+        self.assertEqual(r2.interneds[1].name, 3)
+        self.assertEqual(r2.interneds[0].url, 'url')
+
+    def test_NOT_shared_between_decodes(self):
+        r1 = HasInterned.loads(self.json)[0]
+        r2 = HasInterned.loads(self.json)[0]
+        self.assertIsNot(r1.interned, r2.interned)
+
+    def test_SHARED_identities(self):
+        identities = {}
+        r1 = HasInterned.loads(self.json, identities=identities)[0]
+        r2 = HasInterned.loads(self.json, identities=identities)[0]
+        self.assertIs(r1.interned, r2.interned)
+
+    def test_LAZY_shared(self):
+        Resource.lazy = True
+        try:
+            r1, r2 = HasInterned.loads(self.json)
+            self.assertIs(r1.interned, r2.interned)
+        finally:
+            Resource.lazy = False
+
+
 class TestRawResource(TestCase):
 
     def test_return_original_copy(self):
@@ -1,14 +1,19 @@
 #!/usr/bin/env python
 # -*- encoding: utf-8 -*-
 
+import time
 from datetime import datetime
 
 import requests
 from mock import patch
 
 from pygithub3.tests.utils.core import TestCase
-from pygithub3.services.base import Service, MimeTypeMixin
+from pygithub3.github import Github
+from pygithub3.services.base import (Service, MimeTypeMixin, Deferred,
+                                     Batch)
+from pygithub3.core.cache import MemoryCache
 from pygithub3.core.result import base
+from pygithub3.exceptions import NotFound
 from pygithub3.tests.utils.base import DummyRequest, mock_response
 from pygithub3.tests.utils.services import _, DummyService
 
@@ -55,6 +60,65 @@ class TestServiceCalls(TestCase):
         self.assertFalse(request_method.called)
         self.assertIsInstance(result, base.Result)
 
+    def test_GET_result_with_prefetch(self, request_method):
+        result = Service(prefetch_workers=4)._get_result(self.r)
+        self.assertFalse(request_method.called)
+        self.assertEqual(result.getter.workers, 4)
+
+    def test_GET_results_streamed(self, request_method):
+        service = Service(max_cached_pages=2)
+        self.assertEqual(service._get_result(self.r).getter.max_cached_pages,
+                         2)
+        self.assertEqual(
+            service._get_normal_result(self.r).getter.max_cached_pages, 2)
+        self.assertIsNone(
+            Service()._get_result(self.r).getter.max_cached_pages)
+
+    def test_GET_json(self, request_method):
+        request_method.return_value = mock_response(
+            content='{"id": 1, "created_at": "2008-01-14T04:33:35Z"}')
+        self.s.set_decode('json')
+        self.assertEqual(self.s._get(self.r),
+                         {'id': 1, 'created_at': '2008-01-14T04:33:35Z'})
+
+    def test_INTERNAL_calls_load_resources(self, request_method):
+        request_method.return_value = mock_response(content='{"id": 1}')
+        self.s.set_decode('json')
+        self.r.resource.loads.reset_mock()
+        self.s._get(self.r, decode=False)
+        self.r.resource.loads.assert_called_once_with('{"id": 1}')
+
+    def test_GET_raw(self, request_method):
+        response = mock_response(content='[{"id": 1}]')
+        response.headers = {}
+        request_method.return_value = response
+        service = Service(decode='raw')
+        self.assertEqual(service._get(self.r), '[{"id": 1}]')
+        self.assertEqual(service._get_result(self.r).all(), ['[{"id": 1}]'])
+        self.assertEqual(service._get_normal_result(self.r).all(),
+                         ['[{"id": 1}]'])
+
+    def test_SET_invalid_decode(self, request_method):
+        self.assertRaises(ValueError, self.s.set_decode, 'xml')
+
+    def test_GET_objects_cached(self, request_method):
+        request_method.return_value = mock_response(content='{"id": 1}')
+        service = Service(objects=MemoryCache(), decode='json')
+        sha = 'a' * 40
+        self.assertEqual(service._get_object(self.r, sha), {'id': 1})
+        self.assertEqual(service._get_object(self.r, sha), {'id': 1})
+        self.assertEqual(request_method.call_count, 1)
+        service._get_object(self.r, sha, recursive=1)
+        service._get_object(self.r, sha, headers={'Accept': 'raw'})
+        self.assertEqual(request_method.call_count, 3)
+
+    def test_GET_refs_not_cached(self, request_method):
+        request_method.return_value = mock_response(content='{"id": 1}')
+        service = Service(objects=MemoryCache(), decode='json')
+        service._get_object(self.r, 'master')
+        service._get_object(self.r, 'master')
+        self.assertEqual(request_method.call_count, 2)
+
 
 @patch.object(requests.sessions.Session, 'request')
 class TestMimeType(TestCase):
@@ -75,3 +139,85 @@ class TestMimeType(TestCase):
             headers={'Accept': 'application/vnd.github.%s.html+json' %
                                 MimeTypeMixin.VERSION},
             params={})
+
+
+@patch.object(requests.sessions.Session, 'request')
+class TestDeferred(TestCase):
+
+    def setUp(self):
+        self.gh = Github(user='octocat', repo='repo')
+
+    def test_DEFERRED_calls(self, request_method):
+        request_method.return_value = mock_response(content='{"id": 1}')
+        with self.gh.deferred(workers=2) as deferred:
+            future = deferred.repos.get()
+        self.assertEqual(future.get().id, 1)
+        self.assertEqual(request_method.call_args[0],
+                         ('get', _('repos/octocat/repo')))
+
+    def test_DEFERRED_subservices(self, request_method):
+        with self.gh.deferred() as deferred:
+            self.assertIsInstance(deferred.repos, Deferred)
+            self.assertIsInstance(deferred.repos.commits, Deferred)
+            self.assertIs(deferred.repos.commits.executor, deferred.executor)
+            self.assertEqual(deferred.repos.get_user(), 'octocat')
+
+    def test_SUBMITTED_user_and_repo(self, request_method):
+        request_method.return_value = mock_response(content='{"id": 1}')
+        with self.gh.deferred(workers=1) as deferred:
+            deferred.executor.submit(time.sleep, 0.05)
+            future = deferred.repos.get()
+            named = deferred.repos.get(None, None)
+            deferred.repos.set_repo('other')
+        future.get()
+        named.get()
+        self.assertEqual([call[0] for call in request_method.call_args_list],
+                         [('get', _('repos/octocat/repo'))] * 2)
+
+    def test_SYNCHRONOUS_setters(self, request_method):
+        request_method.return_value = mock_response(content='{"id": 1}')
+        with self.gh.deferred(workers=1) as deferred:
+            self.assertIsNone(deferred.repos.set_repo('other'))
+            future = deferred.repos.get()
+        future.get()
+        self.assertEqual(request_method.call_args[0],
+                         ('get', _('repos/octocat/other')))
+
+    def test_DEFERRED_service(self, request_method):
+        request_method.return_value = mock_response(404)
+        with DummyService().deferred() as deferred:
+            future = deferred._bool(DummyRequest())
+        self.assertFalse(future.get())
+
+
+@patch.object(requests.sessions.Session, 'request')
+class TestBatch(TestCase):
+
+    def setUp(self):
+        self.gh = Github(user='octocat', repo='repo')
+
+    def test_RESULTS_in_order(self, request_method):
+        request_method.side_effect = [
+            mock_response(content='{"id": 1}'), mock_response(404),
+            mock_response(content='{"id": 2}')]
+        with self.gh.batch(workers=1) as batch:
+            batch.repos.get(repo='first')
+            batch.repos.get(repo='missing')
+            batch.users.get('octocat')
+        first, missing, user = batch.results()
+        self.assertEqual(first.id, 1)
+        self.assertIsInstance(missing, NotFound)
+        self.assertEqual(user.id, 2)
+
+    def test_SHARED_queue(self, request_method):
+        request_method.return_value = mock_response(204)
+        with DummyService().batch() as batch:
+            self.assertIsInstance(batch, Batch)
+            batch._bool(DummyRequest())
+            batch.submit(int, '1')
+            self.assertEqual(batch.results(), [True, 1])
+        with self.gh.batch() as batch:
+            self.assertEqual(batch.repos.commits.get_user(), 'octocat')
+            batch.repos.commits.submit(batch.repos.commits.get_user)
+            batch.orgs.members.submit(batch.orgs.members.get_user)
+            self.assertEqual(batch.results(), ['octocat', 'octocat'])
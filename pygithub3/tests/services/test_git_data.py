@@ -1,10 +1,15 @@
 # -*- encoding: utf-8 -*-
 
+import hashlib
+from StringIO import StringIO
+
 import requests
 from mock import patch
 
-from pygithub3.services.git_data import (Blobs, Commits, References, Tags,
-    Trees)
+from pygithub3.services.git_data import (GitData, Blobs, Commits,
+    References, Tags, Trees)
+from pygithub3.services.git_data.blobs import blob_sha
+from pygithub3.services.git_data.trees import TreeIndex, TREE_MODE
 from pygithub3.tests.utils.base import (dummy_json, mock_response,
     mock_response_result)
 from pygithub3.tests.utils.core import TestCase
@@ -30,6 +35,54 @@ class TestBlobsService(TestCase):
         self.assertEqual(reqm.call_args[0],
                          ('post', _('repos/octocat/repo/git/blobs')))
 
+    def mock_raw(self, reqm, headers={'content-length': '5'}):
+        response = mock_response()
+        response.headers = headers
+        response.iter_content.return_value = iter(['hel', 'lo'])
+        reqm.return_value = response
+        return hashlib.sha1('blob 5\0hello').hexdigest()
+
+    def test_STREAM(self, reqm):
+        sha = self.mock_raw(reqm)
+        fileobj = StringIO()
+        self.assertEqual(self.service.stream(sha, fileobj), 5)
+        self.assertEqual(fileobj.getvalue(), 'hello')
+        self.assertEqual(reqm.call_args[0],
+                         ('get', _('repos/octocat/repo/git/blobs/%s' % sha)))
+        self.assertFalse(reqm.call_args[1]['prefetch'])
+        self.assertEqual(reqm.call_args[1]['headers']['Accept'],
+                         'application/vnd.github.%s.raw+json' %
+                         Blobs.VERSION)
+
+    def test_STREAM_to_callback(self, reqm):
+        sha = self.mock_raw(reqm, headers={})
+        chunks = []
+        self.service.stream(sha, chunks.append, size=5)
+        self.assertEqual(chunks, ['hel', 'lo'])
+
+    def test_VERIFY_sha(self, reqm):
+        self.mock_raw(reqm)
+        self.assertRaises(ValueError, list,
+                          self.service.iter_content('abc123'))
+        self.mock_raw(reqm)
+        self.assertEqual(list(self.service.iter_content('abc123',
+                                                        verify=False)),
+                         ['hel', 'lo'])
+        self.mock_raw(reqm, headers={})
+        self.assertRaises(ValueError, list,
+                          self.service.iter_content('abc123'))
+
+    def test_RELEASE_connection(self, reqm):
+        sha = self.mock_raw(reqm)
+        chunks = self.service.iter_content(sha)
+        self.assertEqual(next(chunks), 'hel')
+        chunks.close()
+        reqm.return_value.raw.release_conn.assert_called_once_with()
+        self.mock_raw(reqm)
+        self.assertRaises(ValueError, list,
+                          self.service.iter_content('abc123'))
+        reqm.return_value.raw.release_conn.assert_called_once_with()
+
 
 @dummy_json
 @patch.object(requests.sessions.Session, 'request')
@@ -142,6 +195,12 @@ class TestTreesService(TestCase):
             reqm.call_args[0],
             ('get', _('repos/user/repo/git/trees/abc123'))
         )
+        self.assertEqual(reqm.call_args[1]['params'], {})
+
+    def test_GET_recursive(self, reqm):
+        reqm.return_value = mock_response()
+        self.service.get('abc123', recursive=True)
+        self.assertEqual(reqm.call_args[1]['params'], {'recursive': 1})
 
     def test_CREATE(self, reqm):
         reqm.return_value = mock_response('post')
@@ -155,3 +214,197 @@ class TestTreesService(TestCase):
             reqm.call_args[0],
             ('post', _('repos/user/repo/git/trees'))
         )
+
+
+@dummy_json
+@patch.object(requests.sessions.Session, 'request')
+class TestGitDataService(TestCase):
+
+    def setUp(self):
+        self.service = GitData(user='octocat', repo='repo')
+        self.unchanged = 'unchanged'
+        self.moved = 'moved'
+        self.tree = [
+            dict(path='README', mode='100644', type='blob',
+                 sha=blob_sha(self.unchanged)),
+            dict(path='old', mode='100644', type='blob',
+                 sha=blob_sha(self.moved)),
+            dict(path='run.sh', mode='100755', type='blob',
+                 sha=blob_sha('old script')),
+            dict(path='src', mode='040000', type='tree', sha='tree0')]
+        self.subtree = [dict(path='tool.sh', mode='100755', type='blob',
+                             sha=blob_sha('old tool'))]
+        self.truncated = False
+        self.bodies = []
+
+    def dispatch(self, verb, url, **kwargs):
+        if verb == 'get':
+            recursive = 'recursive' in kwargs.get('params', {})
+            content = {
+                _('repos/octocat/repo/git/refs/heads/master'): dict(
+                    object=dict(sha='head')),
+                _('repos/octocat/repo/git/commits/head'): dict(
+                    tree=dict(sha='base')),
+                _('repos/octocat/repo/git/trees/base'): dict(
+                    tree=self.tree, truncated=recursive and self.truncated),
+                _('repos/octocat/repo/git/trees/tree0'): dict(
+                    tree=self.subtree)}[url]
+            return mock_response(content=content)
+        self.bodies.append((url, kwargs.get('data')))
+        if url.endswith('blobs'):
+            return mock_response('post', content=dict(sha='uploaded'))
+        if url.endswith('trees'):
+            return mock_response('post', content=dict(sha='newtree'))
+        if url.endswith('commits'):
+            return mock_response('post', content=dict(sha='newcommit'))
+        return mock_response('patch', content=dict(ref='heads/master'))
+
+    def test_COMMIT_files(self, reqm):
+        reqm.side_effect = self.dispatch
+        commit = self.service.commit_files({
+            'README': self.unchanged, 'new': self.moved,
+            'text': u'ñ', 'binary': '\0\1'}, 'message', workers=2)
+        self.assertEqual(commit.sha, 'newcommit')
+        urls = [url for url, body in self.bodies]
+        self.assertEqual(urls, [_('repos/octocat/repo/git/blobs'),
+                                _('repos/octocat/repo/git/trees'),
+                                _('repos/octocat/repo/git/commits'),
+                                _('repos/octocat/repo/git/refs/heads/master')])
+        blob, tree, commit, ref = [body for url, body in self.bodies]
+        self.assertEqual(blob, dict(content='AAE=', encoding='base64'))
+        self.assertEqual(tree, dict(base_tree='base', tree=[
+            dict(path='binary', mode='100644', type='blob', sha='uploaded'),
+            dict(path='new', mode='100644', type='blob',
+                 sha=blob_sha(self.moved)),
+            dict(path='text', mode='100644', type='blob', content=u'ñ')]))
+        self.assertEqual(commit, dict(message='message', tree='newtree',
+                                      parents=['head']))
+        self.assertEqual(ref, dict(sha='newcommit'))
+
+    def test_KEEP_executable_mode(self, reqm):
+        reqm.side_effect = self.dispatch
+        self.service.commit_files({'run.sh': 'new script'}, 'message')
+        tree = self.bodies[0][1]['tree']
+        self.assertEqual(tree, [dict(path='run.sh', mode='100755',
+                                     type='blob', content=u'new script')])
+
+    def test_TRUNCATED_tree(self, reqm):
+        reqm.side_effect = self.dispatch
+        self.truncated = True
+        self.service.commit_files({'src/tool.sh': 'new tool',
+                                   'README': self.unchanged}, 'message')
+        tree = self.bodies[0][1]['tree']
+        self.assertEqual(tree, [dict(path='src/tool.sh', mode='100755',
+                                     type='blob', content=u'new tool')])
+
+    def test_COMMIT_files_with_json_decode(self, reqm):
+        reqm.side_effect = self.dispatch
+        self.service.set_decode('json')
+        self.service.trees.set_decode('json')
+        commit = self.service.commit_files({'new': 'new'}, 'message')
+        self.assertEqual(commit.sha, 'newcommit')
+
+    def test_NOTHING_to_commit(self, reqm):
+        reqm.side_effect = self.dispatch
+        self.assertIsNone(self.service.commit_files(
+            {'README': self.unchanged}, 'message'))
+        self.assertEqual(self.bodies, [])
+
+
+def tree_entry(path, sha, mode='100644'):
+    return dict(path=path, mode=mode, sha=sha,
+                type=mode == TREE_MODE and 'tree' or 'blob')
+
+
+@dummy_json
+@patch.object(requests.sessions.Session, 'request')
+class TestTreesDiff(TestCase):
+
+    def sha(self, name):
+        return hashlib.sha1(name).hexdigest()
+
+    def setUp(self):
+        self.service = Trees(user='user', repo='repo')
+        sha = self.sha
+        self.trees = {
+            sha('1'): [tree_entry('README', sha('a')),
+                       tree_entry('docs', sha('d'), TREE_MODE),
+                       tree_entry('old', sha('o')),
+                       tree_entry('src', sha('s'), TREE_MODE)],
+            sha('2'): [tree_entry('README', sha('b')),
+                       tree_entry('docs', sha('d'), TREE_MODE),
+                       tree_entry('new', sha('n'), TREE_MODE),
+                       tree_entry('src', sha('t'), TREE_MODE)],
+            sha('d'): [tree_entry('index.rst', sha('i'))],
+            sha('s'): [tree_entry('app.py', sha('x')),
+                       tree_entry('lib.py', sha('y'))],
+            sha('t'): [tree_entry('app.py', sha('x')),
+                       tree_entry('lib.py', sha('z')),
+                       tree_entry('util.py', sha('u'))],
+            sha('n'): [tree_entry('a.txt', sha('e'))]}
+        self.recursive = {sha('1'): self.trees[sha('1')][:2] + [
+            tree_entry('docs/index.rst', sha('i'))] + [
+            self.trees[sha('1')][2], self.trees[sha('1')][3],
+            tree_entry('src/app.py', sha('x')),
+            tree_entry('src/lib.py', sha('y'))]}
+        self.recursive[sha('n')] = self.trees[sha('n')]
+        self.fetched = []
+
+    def dispatch(self, verb, url, params):
+        tree_sha = url.rsplit('/', 1)[-1]
+        self.fetched.append([name for name in '12dstn'
+                             if self.sha(name) == tree_sha][0])
+        if 'recursive' in params:
+            return mock_response(content=dict(
+                sha=tree_sha, tree=self.recursive[tree_sha]))
+        return mock_response(content=dict(sha=tree_sha,
+                                          tree=self.trees[tree_sha]))
+
+    def test_INDEX(self, reqm):
+        reqm.side_effect = self.dispatch
+        index = self.service.index(self.sha('1'))
+        self.assertEqual(len(index), 7)
+        self.assertEqual(index.get('src/lib.py'), ('100644', self.sha('y')))
+        self.assertIsNone(index.get('missing'))
+        self.assertEqual(sorted(index.children('')),
+                         ['README', 'docs', 'old', 'src'])
+        self.assertEqual(index.children('src/'), {
+            'app.py': ('100644', self.sha('x')),
+            'lib.py': ('100644', self.sha('y'))})
+        self.assertEqual([path for path, mode, sha in index.under('docs/')],
+                         ['docs/index.rst'])
+        fileobj = StringIO()
+        index.dump(fileobj)
+        fileobj.seek(0)
+        loaded = TreeIndex.load(fileobj)
+        self.assertEqual(loaded.sha, index.sha)
+        self.assertEqual(list(loaded), list(index))
+
+    def test_DIFF_only_changed_subtrees(self, reqm):
+        reqm.side_effect = self.dispatch
+        changes = list(self.service.diff(self.sha('1'), self.sha('2')))
+        sha = self.sha
+        self.assertEqual(changes, [
+            ('modified', 'README', sha('a'), sha('b')),
+            ('added', 'new/a.txt', None, sha('e')),
+            ('removed', 'old', sha('o'), None),
+            ('modified', 'src/lib.py', sha('y'), sha('z')),
+            ('added', 'src/util.py', None, sha('u'))])
+        self.assertEqual(self.fetched, ['1', '2', 'n', 's', 't'])
+
+    def test_JSON_decode(self, reqm):
+        reqm.side_effect = self.dispatch
+        self.service.set_decode('json')
+        self.assertIsInstance(self.service.get(self.sha('2')), dict)
+        self.assertEqual(len(self.service.index(self.sha('1'))), 7)
+        self.assertEqual(len(list(self.service.diff(self.sha('1'),
+                                                    self.sha('2')))), 5)
+
+    def test_DIFF_from_index(self, reqm):
+        reqm.side_effect = self.dispatch
+        index = self.service.index(self.sha('1'))
+        self.fetched = []
+        changes = list(self.service.diff(index, self.sha('2')))
+        self.assertEqual(len(changes), 5)
+        self.assertEqual(self.fetched, ['2', 'n', 't'])
+        self.assertEqual(list(self.service.diff(index, index)), [])
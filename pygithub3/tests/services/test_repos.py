@@ -1,5 +1,8 @@
 # -*- encoding: utf-8 -*-
 
+import os
+import tempfile
+
 import requests
 from mock import patch
 
@@ -266,6 +269,41 @@ class TestDownloadsService(TestCase):
                          ('post', _('repos/oct/re_oct/downloads')))
         self.assertTrue(hasattr(download, 'upload'))
 
+    def test_CREATE_with_json_decode(self, request_method):
+        request_method.return_value = mock_response('post')
+        self.ds.set_decode('json')
+        download = self.ds.create({'name': 'some', 'size': 100})
+        self.assertTrue(hasattr(download, 'upload'))
+
+    def test_UPLOAD(self, request_method):
+        request_method.return_value = mock_response('post', content=dict(
+            path='downloads/oct/re_oct/file.ext', acl='public-read',
+            name='file.ext', accesskeyid='key', policy='policy',
+            signature='signature', mime_type='text/plain', size=4,
+            s3_url='https://github.s3.amazonaws.com/'))
+        download = self.ds.create({'name': 'file.ext', 'size': 4})
+        bodies = []
+
+        def send(verb, url, data, headers):
+            bodies.append(data.read())
+            return mock_response(201)
+        request_method.side_effect = send
+        fileobj = tempfile.NamedTemporaryFile()
+        fileobj.write('data')
+        fileobj.flush()
+        with patch('__builtin__.open', return_value=open(fileobj.name)) as o:
+            response = download.upload(fileobj.name)
+        self.assertTrue(o.return_value.closed)
+        verb, url = request_method.call_args[0]
+        self.assertEqual((verb, url),
+                         ('post', 'https://github.s3.amazonaws.com/'))
+        headers = request_method.call_args[1]['headers']
+        self.assertEqual(headers['Content-Length'], str(len(bodies[0])))
+        self.assertIn('name="File"; filename="%s"' % (
+                      os.path.basename(fileobj.name)), bodies[0])
+        self.assertIn('\r\n\r\ndata\r\n', bodies[0])
+        self.assertEqual(response.upload_stats['bytes'], len(bodies[0]))
+
 
 @dummy_json
 @patch.object(requests.sessions.Session, 'request')
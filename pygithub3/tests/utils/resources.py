@@ -20,3 +20,22 @@ class Nested(Resource):
         'self_nested_list': 'self',
         'self_nested_dict': 'self',
     }
+
+
+class Compacted(Resource):
+    _dates = ('date', )
+    _maps = {'simple': Simple}
+    _fields = ('id', 'date', 'simple', 'missing')
+    compact = True
+
+    def __str__(self):
+        return '<Compacted (%s)>' % getattr(self, 'id', '')
+
+
+class Interned(Resource):
+    _interned = True
+
+
+class HasInterned(Resource):
+    _maps = {'interned': Interned}
+    _collection_maps = {'interneds': Interned}